@@ -37,7 +37,7 @@ def print_footer():
 
 
 def bench_group(name, group):
-    global grp, generator, scalars, points, points2
+    global grp, generator, scalars, points, points2, results
     global input_strings, input_strings_long
 
     order = group.order()
@@ -50,18 +50,23 @@ def bench_group(name, group):
     points2 = [order.random() * group.generator() for _ in range(NR_ELEMS)]
     input_strings = [secrets.token_bytes(32) for _ in range(NR_ELEMS)]
     input_strings_long = [secrets.token_bytes(1024) for _ in range(NR_ELEMS)]
+    results = [group.neutral_element() for _ in range(NR_ELEMS)]
 
     print("\n")
     print_header("Group " + name)
 
     print_time("Square", "[p.double() for p in points]")
 
+    print_time("Square (preallocated)", "[p.double_into(r) for p, r in zip(points, results)]")
+
     print_time("Multiplication", "[p + q for p, q in zip(points, points2)]")
 
     print_time("Exponentiation (generator)", "[s * generator for s in scalars]")
 
     print_time("Exponentiation (point)", "[s * p for s, p in zip(scalars, points)]")
 
+    print_time("Exponentiation (point, batch)", "grp.mul_batch(scalars, points)")
+
     for bits in [2 ** x for x in range(3, 9)]:
         scalars = [Bn.get_random(bits) for _ in range(NR_ELEMS)]
         print_time(
@@ -77,7 +82,12 @@ def bench_group(name, group):
 
         print_time(
             "Hash to point (1024 bytes input)",
-            "[grp.hash_to_point(s) for s in input_strings]",
+            "[grp.hash_to_point(s) for s in input_strings_long]",
+        )
+
+        print_time(
+            "Hash to point (batch, 32 bytes)",
+            "grp.hash_to_point_batch(input_strings)",
         )
 
     print_time("Export", "[p for p in points]")
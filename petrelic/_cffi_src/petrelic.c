@@ -1,7 +1,10 @@
+#include <stdlib.h>
 #include <relic/relic.h>
 
 const int CONST_RLC_DIG = RLC_DIG;
 const int CONST_RLC_OK = RLC_OK;
+const int CONST_RLC_G1_TABLE = RLC_EP_TABLE;
+const int CONST_RLC_G2_TABLE = RLC_EPX_TABLE;
 
 const int CONST_RLC_POS = RLC_POS;
 const int CONST_RLC_NEG = RLC_NEG;
@@ -17,3 +20,937 @@ unsigned int get_rlc_dig(void) {
 int get_rlc_ok(void) {
   return RLC_OK;
 }
+
+/*
+ * Checks that 0 <= a < m.
+ */
+static int petrelic_bn_is_reduced(bn_t a, bn_t m) {
+  return bn_sign(a) == RLC_POS && bn_cmp(a, m) == RLC_LT;
+}
+
+/*
+ * Sets r to k mod m, or to m - (k mod m) when that is smaller, in which case
+ * it returns 1. Small negative scalars thus stay small.
+ */
+static int petrelic_bn_mod_short(bn_t r, bn_t k, bn_t m) {
+  int neg = 0;
+  bn_t t;
+
+  bn_null(t);
+  bn_new(t);
+
+  if (petrelic_bn_is_reduced(k, m)) {
+    bn_copy(r, k);
+  } else {
+    bn_mod(r, k, m);
+  }
+  bn_sub(t, m, r);
+  if (bn_cmp(t, r) == RLC_LT) {
+    bn_copy(r, t);
+    neg = 1;
+  }
+
+  bn_free(t);
+  return neg;
+}
+
+/*
+ * Computes r = a + b mod m. When both operands are already reduced, a
+ * conditional subtraction replaces the division.
+ */
+void petrelic_bn_mod_add(bn_t r, bn_t a, bn_t b, bn_t m) {
+  if (petrelic_bn_is_reduced(a, m) && petrelic_bn_is_reduced(b, m)) {
+    bn_add(r, a, b);
+    if (bn_cmp(r, m) != RLC_LT) {
+      bn_sub(r, r, m);
+    }
+  } else {
+    bn_add(r, a, b);
+    bn_mod(r, r, m);
+  }
+}
+
+/*
+ * Computes r = a - b mod m. When both operands are already reduced, a
+ * conditional addition replaces the division.
+ */
+void petrelic_bn_mod_sub(bn_t r, bn_t a, bn_t b, bn_t m) {
+  if (petrelic_bn_is_reduced(a, m) && petrelic_bn_is_reduced(b, m)) {
+    bn_sub(r, a, b);
+    if (bn_sign(r) == RLC_NEG) {
+      bn_add(r, r, m);
+    }
+  } else {
+    bn_sub(r, a, b);
+    bn_mod(r, r, m);
+  }
+}
+
+/*
+ * Computes r = a * b mod m.
+ */
+void petrelic_bn_mod_mul(bn_t r, bn_t a, bn_t b, bn_t m) {
+  bn_mul(r, a, b);
+  bn_mod(r, r, m);
+}
+
+/*
+ * Computes r = k mod m, where u is the Barrett constant of m computed by
+ * bn_mod_pre_barrt. Reduced inputs are copied, and non-negative inputs below
+ * m^2 use Barrett reduction instead of a long division.
+ */
+void petrelic_bn_mod_barrt(bn_t r, bn_t k, bn_t m, bn_t u) {
+  if (petrelic_bn_is_reduced(k, m)) {
+    bn_copy(r, k);
+  } else if (bn_sign(k) == RLC_POS && bn_bits(k) <= 2 * (bn_bits(m) - 1)) {
+    bn_mod_barrt(r, k, m, u);
+  } else {
+    bn_mod(r, k, m);
+  }
+}
+
+/*
+ * Largest window width used by petrelic_bn_pow.
+ */
+#define PETRELIC_BN_WINDOW 4
+
+/*
+ * Computes r = a^b for a non-negative exponent b with left-to-right sliding
+ * windows over a table of odd powers of a.
+ */
+void petrelic_bn_pow(bn_t r, bn_t a, bn_t b) {
+  int i, j, k, d, w, m, bits = bn_bits(b);
+  bn_t t[1 << (PETRELIC_BN_WINDOW - 1)], u;
+
+  w = (bits > 32) ? PETRELIC_BN_WINDOW : ((bits > 8) ? 2 : 1);
+  m = 1 << (w - 1);
+
+  bn_null(u);
+  bn_new(u);
+  for (i = 0; i < m; i++) {
+    bn_null(t[i]);
+    bn_new(t[i]);
+  }
+
+  /* Odd powers a, a^3, ..., a^(2m - 1). */
+  bn_copy(t[0], a);
+  bn_sqr(u, a);
+  for (i = 1; i < m; i++) {
+    bn_mul(t[i], t[i - 1], u);
+  }
+
+  bn_set_dig(r, 1);
+  for (i = bits - 1; i >= 0;) {
+    if (!bn_get_bit(b, i)) {
+      bn_sqr(r, r);
+      i--;
+      continue;
+    }
+    k = RLC_MAX(i - w + 1, 0);
+    while (!bn_get_bit(b, k)) {
+      k++;
+    }
+    d = 0;
+    for (j = i; j >= k; j--) {
+      bn_sqr(r, r);
+      d = (d << 1) | bn_get_bit(b, j);
+    }
+    bn_mul(r, r, t[d >> 1]);
+    i = k - 1;
+  }
+
+  bn_free(u);
+  for (i = 0; i < m; i++) {
+    bn_free(t[i]);
+  }
+}
+
+/*
+ * Computes r = a^b mod m for a non-negative exponent b. Odd moduli go through
+ * RELIC's bn_mxp; its Montgomery reduction does not support even moduli, so
+ * these are handled with a plain square and multiply.
+ */
+void petrelic_bn_mxp(bn_t r, bn_t a, bn_t b, bn_t m) {
+  int i;
+  bn_t t;
+
+  bn_null(t);
+  bn_new(t);
+  bn_mod(t, a, m);
+
+  if (!bn_is_even(m)) {
+    bn_mxp(r, t, b, m);
+  } else {
+    bn_set_dig(r, 1);
+    for (i = bn_bits(b) - 1; i >= 0; i--) {
+      bn_sqr(r, r);
+      bn_mod(r, r, m);
+      if (bn_get_bit(b, i)) {
+        bn_mul(r, r, t);
+        bn_mod(r, r, m);
+      }
+    }
+  }
+
+  bn_free(t);
+}
+
+
+/*
+ * Initializes a freshly allocated element in a single call.
+ */
+void petrelic_g1_init(g1_t p) {
+  g1_null(p);
+  g1_new(p);
+}
+
+void petrelic_g2_init(g2_t p) {
+  g2_null(p);
+  g2_new(p);
+}
+
+void petrelic_gt_init(gt_t p) {
+  gt_null(p);
+  gt_new(p);
+}
+
+/*
+ * Computes r = k * p. Scalars that fit in a single digit, such as small
+ * weights, use RELIC's single-digit multiplication.
+ */
+void petrelic_g1_mul(g1_t r, g1_t p, bn_t k) {
+  dig_t d;
+
+  if (bn_bits(k) > RLC_DIG) {
+    g1_mul(r, p, k);
+    return;
+  }
+  bn_get_dig(&d, k);
+  g1_mul_dig(r, p, d);
+  if (bn_sign(k) == RLC_NEG) {
+    g1_neg(r, r);
+  }
+}
+
+void petrelic_g2_mul(g2_t r, g2_t p, bn_t k) {
+  dig_t d;
+
+  if (bn_bits(k) > RLC_DIG) {
+    g2_mul(r, p, k);
+    return;
+  }
+  bn_get_dig(&d, k);
+  g2_mul_dig(r, p, d);
+  if (bn_sign(k) == RLC_NEG) {
+    g2_neg(r, r);
+  }
+}
+
+/*
+ * Computes r = k * p with RELIC's Montgomery ladder, whose sequence of
+ * operations does not depend on the bits of k. Used for secret scalars.
+ */
+void petrelic_g1_mul_monty(g1_t r, g1_t p, bn_t k) {
+  ep_mul_monty(r, p, k);
+}
+
+void petrelic_g2_mul_monty(g2_t r, g2_t p, bn_t k) {
+  ep2_mul_monty(r, p, k);
+}
+
+/*
+ * Returns the length of the encoding of p, like g1_size_bin but without
+ * normalizing p first, which costs a field inversion.
+ */
+int petrelic_g1_size_bin(g1_t p, int pack) {
+  if (g1_is_infty(p)) {
+    return 1;
+  }
+  return pack ? 1 + RLC_FP_BYTES : 1 + 2 * RLC_FP_BYTES;
+}
+
+int petrelic_g2_size_bin(g2_t p, int pack) {
+  if (g2_is_infty(p)) {
+    return 1;
+  }
+  return pack ? 1 + 2 * RLC_FP_BYTES : 1 + 4 * RLC_FP_BYTES;
+}
+
+/*
+ * Returns the length of the encoding of p, like gt_size_bin but without
+ * testing again that p is in the cyclotomic subgroup; gt_write_bin does.
+ */
+int petrelic_gt_size_bin(gt_t p, int pack) {
+  (void)p;
+  return pack ? 8 * RLC_FP_BYTES : 12 * RLC_FP_BYTES;
+}
+
+/*
+ * Hashes each of the n inputs bin[i] of length len[i] to the point r[i].
+ */
+void petrelic_g1_map_lot(g1_st **r, const char **bin, const int *len, int n) {
+  int i;
+
+  for (i = 0; i < n; i++) {
+    g1_map(r[i], (const uint8_t *)bin[i], len[i]);
+  }
+}
+
+void petrelic_g2_map_lot(g2_st **r, const char **bin, const int *len, int n) {
+  int i;
+
+  for (i = 0; i < n; i++) {
+    g2_map(r[i], (const uint8_t *)bin[i], len[i]);
+  }
+}
+
+/*
+ * Computes r[i] = k[i] * p[i] for each of the n points.
+ */
+void petrelic_g1_mul_lot(g1_st **r, g1_st **p, bn_st **k, int n) {
+  int i;
+
+  for (i = 0; i < n; i++) {
+    petrelic_g1_mul(r[i], p[i], k[i]);
+  }
+}
+
+void petrelic_g2_mul_lot(g2_st **r, g2_st **p, bn_st **k, int n) {
+  int i;
+
+  for (i = 0; i < n; i++) {
+    petrelic_g2_mul(r[i], p[i], k[i]);
+  }
+}
+
+/*
+ * Computes r = p[0] + ... + p[n-1], reducing the points pairwise as a
+ * balanced tree. The partial sums are kept in t, which must hold (n + 1) / 2
+ * points, so that the caller only has to pass pointers to its points.
+ */
+void petrelic_g1_add_lot(g1_t r, g1_t *t, g1_st **p, int n) {
+  int i, m, step;
+
+  if (n == 0) {
+    g1_set_infty(r);
+    return;
+  }
+
+  /* The first round reads straight from the inputs. */
+  m = (n + 1) / 2;
+  for (i = 0; i < n / 2; i++) {
+    g1_add(t[i], p[2 * i], p[2 * i + 1]);
+  }
+  if (n & 1) {
+    g1_copy(t[m - 1], p[n - 1]);
+  }
+
+  for (step = 1; step < m; step *= 2) {
+    for (i = 0; i + step < m; i += 2 * step) {
+      g1_add(t[i], t[i], t[i + step]);
+    }
+  }
+  g1_copy(r, t[0]);
+}
+
+void petrelic_g2_add_lot(g2_t r, g2_t *t, g2_st **p, int n) {
+  int i, m, step;
+
+  if (n == 0) {
+    g2_set_infty(r);
+    return;
+  }
+
+  /* The first round reads straight from the inputs. */
+  m = (n + 1) / 2;
+  for (i = 0; i < n / 2; i++) {
+    g2_add(t[i], p[2 * i], p[2 * i + 1]);
+  }
+  if (n & 1) {
+    g2_copy(t[m - 1], p[n - 1]);
+  }
+
+  for (step = 1; step < m; step *= 2) {
+    for (i = 0; i + step < m; i += 2 * step) {
+      g2_add(t[i], t[i], t[i + step]);
+    }
+  }
+  g2_copy(r, t[0]);
+}
+
+/*
+ * Computes r = k[0] * p[0] + ... + k[n-1] * p[n-1] with RELIC's simultaneous
+ * multiplication, so that all terms share the same doublings. Linear
+ * combinations of two points, as in Schnorr-style verification, use the
+ * dedicated two-term routine. The scalars must be non-negative.
+ */
+void petrelic_g1_mul_sim_lot(g1_t r, g1_t *p, bn_t *k, int n) {
+  if (n == 0) {
+    g1_set_infty(r);
+  } else if (n == 1) {
+    petrelic_g1_mul(r, p[0], k[0]);
+  } else if (n == 2) {
+    g1_mul_sim(r, p[0], k[0], p[1], k[1]);
+  } else {
+    g1_mul_sim_lot(r, p, k, n);
+  }
+}
+
+void petrelic_g2_mul_sim_lot(g2_t r, g2_t *p, bn_t *k, int n) {
+  if (n == 0) {
+    g2_set_infty(r);
+  } else if (n == 1) {
+    petrelic_g2_mul(r, p[0], k[0]);
+  } else if (n == 2) {
+    g2_mul_sim(r, p[0], k[0], p[1], k[1]);
+  } else {
+    g2_mul_sim_lot(r, p, k, n);
+  }
+}
+
+/*
+ * Computes r = k[0] * p[0] + ... + k[n-1] * p[n-1] for arbitrary scalars k[i].
+ * The scalars are reduced and the points gathered here, so that a weighted
+ * sum costs a single call from Python.
+ */
+void petrelic_g1_wsum(g1_t r, g1_st **p, bn_st **k, int n) {
+  int i;
+  bn_t ord, *b;
+  g1_t t, *q;
+
+  bn_null(ord);
+  bn_new(ord);
+  g1_get_ord(ord);
+
+  b = (bn_t *)malloc((size_t)n * sizeof(bn_t));
+  q = (g1_t *)malloc((size_t)n * sizeof(g1_t));
+  if (b == NULL || q == NULL) {
+    /* Accumulate the terms one by one when the arrays cannot be allocated. */
+    free(b);
+    free(q);
+    g1_null(t);
+    g1_new(t);
+    g1_set_infty(r);
+    for (i = 0; i < n; i++) {
+      petrelic_g1_mul(t, p[i], k[i]);
+      g1_add(r, r, t);
+    }
+    g1_free(t);
+    bn_free(ord);
+    return;
+  }
+
+  for (i = 0; i < n; i++) {
+    bn_null(b[i]);
+    bn_new(b[i]);
+    g1_null(q[i]);
+    g1_new(q[i]);
+    if (petrelic_bn_mod_short(b[i], k[i], ord)) {
+      g1_neg(q[i], p[i]);
+    } else {
+      g1_copy(q[i], p[i]);
+    }
+  }
+
+  petrelic_g1_mul_sim_lot(r, q, b, n);
+
+  for (i = 0; i < n; i++) {
+    bn_free(b[i]);
+    g1_free(q[i]);
+  }
+  free(b);
+  free(q);
+  bn_free(ord);
+}
+
+void petrelic_g2_wsum(g2_t r, g2_st **p, bn_st **k, int n) {
+  int i;
+  bn_t ord, *b;
+  g2_t t, *q;
+
+  bn_null(ord);
+  bn_new(ord);
+  g2_get_ord(ord);
+
+  b = (bn_t *)malloc((size_t)n * sizeof(bn_t));
+  q = (g2_t *)malloc((size_t)n * sizeof(g2_t));
+  if (b == NULL || q == NULL) {
+    /* Accumulate the terms one by one when the arrays cannot be allocated. */
+    free(b);
+    free(q);
+    g2_null(t);
+    g2_new(t);
+    g2_set_infty(r);
+    for (i = 0; i < n; i++) {
+      petrelic_g2_mul(t, p[i], k[i]);
+      g2_add(r, r, t);
+    }
+    g2_free(t);
+    bn_free(ord);
+    return;
+  }
+
+  for (i = 0; i < n; i++) {
+    bn_null(b[i]);
+    bn_new(b[i]);
+    g2_null(q[i]);
+    g2_new(q[i]);
+    if (petrelic_bn_mod_short(b[i], k[i], ord)) {
+      g2_neg(q[i], p[i]);
+    } else {
+      g2_copy(q[i], p[i]);
+    }
+  }
+
+  petrelic_g2_mul_sim_lot(r, q, b, n);
+
+  for (i = 0; i < n; i++) {
+    bn_free(b[i]);
+    g2_free(q[i]);
+  }
+  free(b);
+  free(q);
+  bn_free(ord);
+}
+
+
+/*
+ * Computes r = a / b in a single call. Inversion in GT is a conjugation, so
+ * this costs about one multiplication. r may alias a or b.
+ */
+void petrelic_gt_div(gt_t r, gt_t a, gt_t b) {
+  gt_t t;
+
+  gt_null(t);
+  gt_new(t);
+  gt_inv(t, b);
+  gt_mul(r, a, t);
+  gt_free(t);
+}
+
+/*
+ * Multiplies the accumulator r by a. While *one is set, r is known to be the
+ * unity, so a is copied instead.
+ */
+static void petrelic_gt_mul_acc(gt_t r, gt_t a, int *one) {
+  if (*one) {
+    gt_copy(r, a);
+    *one = 0;
+  } else {
+    gt_mul(r, r, a);
+  }
+}
+
+/*
+ * Window width of the NAF used by petrelic_gt_exp_slide.
+ */
+#define PETRELIC_GT_NAF_WIDTH 5
+
+/*
+ * Computes r = a^k in GT with a width-w NAF of k. Only the odd powers a, a^3,
+ * ..., a^(2^(w-1) - 1) are tabulated; negative digits use their inverses,
+ * which are cheap to compute in GT.
+ */
+static void petrelic_gt_exp_slide(gt_t r, gt_t a, bn_t k) {
+  int i, j, c, v, bits = bn_bits(k), m = 1 << (PETRELIC_GT_NAF_WIDTH - 2);
+  int one = 1;
+  int8_t *naf;
+  gt_t t[1 << (PETRELIC_GT_NAF_WIDTH - 2)], u[1 << (PETRELIC_GT_NAF_WIDTH - 2)];
+
+  naf = (int8_t *)calloc((size_t)bits + 1, sizeof(int8_t));
+  if (naf == NULL) {
+    gt_exp(r, a, k);
+    return;
+  }
+
+  /* Recode k, least significant bit first, keeping track of the carry. */
+  for (i = 0, c = 0; i <= bits;) {
+    if ((i < bits && bn_get_bit(k, i)) == c) {
+      i++;
+      continue;
+    }
+    v = c;
+    for (j = 0; j < PETRELIC_GT_NAF_WIDTH && i + j < bits; j++) {
+      v += bn_get_bit(k, i + j) << j;
+    }
+    if (v >= (1 << (PETRELIC_GT_NAF_WIDTH - 1))) {
+      naf[i] = (int8_t)(v - (1 << PETRELIC_GT_NAF_WIDTH));
+      c = 1;
+    } else {
+      naf[i] = (int8_t)v;
+      c = 0;
+    }
+    i += PETRELIC_GT_NAF_WIDTH;
+  }
+
+  for (i = 0; i < m; i++) {
+    gt_null(t[i]);
+    gt_null(u[i]);
+    gt_new(t[i]);
+    gt_new(u[i]);
+  }
+
+  /* The exponent is applied to a^-1 when it is negative. */
+  if (bn_sign(k) == RLC_NEG) {
+    gt_inv(t[0], a);
+  } else {
+    gt_copy(t[0], a);
+  }
+  fp12_sqr_cyc(u[0], t[0]);
+  for (i = 1; i < m; i++) {
+    gt_mul(t[i], t[i - 1], u[0]);
+  }
+  for (i = 0; i < m; i++) {
+    gt_inv(u[i], t[i]);
+  }
+
+  gt_set_unity(r);
+  for (i = bits; i >= 0; i--) {
+    if (!one) {
+      fp12_sqr_cyc(r, r);
+    }
+    if (naf[i] > 0) {
+      petrelic_gt_mul_acc(r, t[naf[i] / 2], &one);
+    } else if (naf[i] < 0) {
+      petrelic_gt_mul_acc(r, u[-naf[i] / 2], &one);
+    }
+  }
+
+  for (i = 0; i < m; i++) {
+    gt_free(t[i]);
+    gt_free(u[i]);
+  }
+  free(naf);
+}
+
+/*
+ * Computes r = a^k in GT, using the single precision exponentiation when k
+ * fits in one digit and a windowed NAF otherwise.
+ */
+void petrelic_gt_exp(gt_t r, gt_t a, bn_t k) {
+  dig_t d;
+
+  if (bn_is_zero(k)) {
+    gt_set_unity(r);
+  } else if (bn_sign(k) == RLC_POS && bn_bits(k) <= RLC_DIG) {
+    bn_get_dig(&d, k);
+    gt_exp_dig(r, a, d);
+  } else {
+    petrelic_gt_exp_slide(r, a, k);
+  }
+}
+
+/*
+ * Computes r[i] = a[i]^k[i] for each of the n elements of GT.
+ */
+void petrelic_gt_exp_lot(fp6_t **r, fp6_t **a, bn_st **k, int n) {
+  int i;
+
+  for (i = 0; i < n; i++) {
+    petrelic_gt_exp(r[i], a[i], k[i]);
+  }
+}
+
+/*
+ * Interleaved binary exponentiation, used when the tables for the windowed
+ * method cannot be allocated.
+ */
+static void petrelic_gt_exp_sim_lot_basic(gt_t r, gt_t *a, bn_t *b, int n,
+    int bits) {
+  int i, j, one = 1;
+
+  gt_set_unity(r);
+  for (j = bits - 1; j >= 0; j--) {
+    if (!one) {
+      fp12_sqr_cyc(r, r);
+    }
+    for (i = 0; i < n; i++) {
+      if (bn_get_bit(b[i], j)) {
+        petrelic_gt_mul_acc(r, a[i], &one);
+      }
+    }
+  }
+}
+
+/*
+ * Computes r = a[0]^b[0] * ... * a[n-1]^b[n-1] in GT.
+ *
+ * The exponentiations are interleaved (Strauss-Shamir) so that all terms
+ * share the same squarings. Each exponent is recoded with sliding windows
+ * over a table of odd powers of its base. The bases in a are used as scratch
+ * space.
+ */
+void petrelic_gt_exp_sim_lot(gt_t r, gt_t *a, bn_t *b, int n) {
+  int i, j, k, l, d, w, m, bits = 0, one = 1;
+  int *digits;
+  gt_t *t;
+
+  for (i = 0; i < n; i++) {
+    if (bn_sign(b[i]) == RLC_NEG) {
+      gt_inv(a[i], a[i]);
+    }
+    bits = RLC_MAX(bits, bn_bits(b[i]));
+  }
+
+  if (n == 0 || bits == 0) {
+    gt_set_unity(r);
+    return;
+  }
+
+  w = (bits > 128) ? 4 : ((bits > 32) ? 3 : 2);
+  m = 1 << (w - 1);
+  t = (gt_t *)malloc((size_t)n * m * sizeof(gt_t));
+  digits = (int *)calloc((size_t)n * bits, sizeof(int));
+  if (t == NULL || digits == NULL) {
+    free(t);
+    free(digits);
+    petrelic_gt_exp_sim_lot_basic(r, a, b, n, bits);
+    return;
+  }
+
+  for (i = 0; i < n * m; i++) {
+    gt_null(t[i]);
+    gt_new(t[i]);
+  }
+
+  for (i = 0; i < n; i++) {
+    /* Odd powers a[i], a[i]^3, ..., a[i]^(2m - 1). */
+    gt_copy(t[i * m], a[i]);
+    fp12_sqr_cyc(a[i], a[i]);
+    for (k = 1; k < m; k++) {
+      gt_mul(t[i * m + k], t[i * m + k - 1], a[i]);
+    }
+
+    /* Store each odd window digit at the position of its lowest bit. */
+    for (j = bn_bits(b[i]) - 1; j >= 0;) {
+      if (!bn_get_bit(b[i], j)) {
+        j--;
+        continue;
+      }
+      k = RLC_MAX(j - w + 1, 0);
+      while (!bn_get_bit(b[i], k)) {
+        k++;
+      }
+      d = 0;
+      for (l = j; l >= k; l--) {
+        d = (d << 1) | bn_get_bit(b[i], l);
+      }
+      digits[i * bits + k] = d;
+      j = k - 1;
+    }
+  }
+
+  gt_set_unity(r);
+  for (j = bits - 1; j >= 0; j--) {
+    if (!one) {
+      fp12_sqr_cyc(r, r);
+    }
+    for (i = 0; i < n; i++) {
+      d = digits[i * bits + j];
+      if (d != 0) {
+        petrelic_gt_mul_acc(r, t[i * m + (d - 1) / 2], &one);
+      }
+    }
+  }
+
+  for (i = 0; i < n * m; i++) {
+    gt_free(t[i]);
+  }
+  free(t);
+  free(digits);
+}
+
+/*
+ * Computes r = a[0]^k[0] * ... * a[n-1]^k[n-1] for arbitrary exponents k[i],
+ * reducing the exponents and gathering the bases as petrelic_g1_wsum does.
+ */
+void petrelic_gt_wprod(gt_t r, fp6_t **a, bn_st **k, int n) {
+  int i;
+  bn_t ord, *b;
+  gt_t t, *q;
+
+  bn_null(ord);
+  bn_new(ord);
+  gt_get_ord(ord);
+
+  b = (bn_t *)malloc((size_t)n * sizeof(bn_t));
+  q = (gt_t *)malloc((size_t)n * sizeof(gt_t));
+  if (b == NULL || q == NULL) {
+    /* Accumulate the terms one by one when the arrays cannot be allocated. */
+    free(b);
+    free(q);
+    gt_null(t);
+    gt_new(t);
+    gt_set_unity(r);
+    for (i = 0; i < n; i++) {
+      petrelic_gt_exp(t, a[i], k[i]);
+      gt_mul(r, r, t);
+    }
+    gt_free(t);
+    bn_free(ord);
+    return;
+  }
+
+  for (i = 0; i < n; i++) {
+    bn_null(b[i]);
+    bn_new(b[i]);
+    gt_null(q[i]);
+    gt_new(q[i]);
+    if (petrelic_bn_mod_short(b[i], k[i], ord)) {
+      gt_inv(q[i], a[i]);
+    } else {
+      gt_copy(q[i], a[i]);
+    }
+  }
+
+  petrelic_gt_exp_sim_lot(r, q, b, n);
+
+  for (i = 0; i < n; i++) {
+    bn_free(b[i]);
+    gt_free(q[i]);
+  }
+  free(b);
+  free(q);
+  bn_free(ord);
+}
+
+/*
+ * Computes r = a[0] * ... * a[n-1] in GT.
+ *
+ * The product is reduced pairwise as a balanced tree, so that the
+ * multiplications within a round are independent of each other. The partial
+ * products are kept in t, which must hold (n + 1) / 2 elements.
+ */
+void petrelic_gt_mul_lot(gt_t r, gt_t *t, fp6_t **a, int n) {
+  int i, m, step;
+
+  if (n == 0) {
+    gt_set_unity(r);
+    return;
+  }
+
+  /* The first round reads straight from the inputs. */
+  m = (n + 1) / 2;
+  for (i = 0; i < n / 2; i++) {
+    gt_mul(t[i], a[2 * i], a[2 * i + 1]);
+  }
+  if (n & 1) {
+    gt_copy(t[m - 1], a[n - 1]);
+  }
+
+  for (step = 1; step < m; step *= 2) {
+    for (i = 0; i + step < m; i += 2 * step) {
+      gt_mul(t[i], t[i], t[i + step]);
+    }
+  }
+  gt_copy(r, t[0]);
+}
+
+/*
+ * Window width of the tables used for fixed-base exponentiation in GT.
+ */
+#define PETRELIC_GT_DEPTH 4
+
+static int petrelic_gt_windows(void) {
+  /* The group order never changes, so it is only read once. */
+  static int l = 0;
+  bn_t n;
+
+  if (l == 0) {
+    bn_null(n);
+    bn_new(n);
+    gt_get_ord(n);
+    l = RLC_CEIL(bn_bits(n), PETRELIC_GT_DEPTH);
+    bn_free(n);
+  }
+
+  return l;
+}
+
+/*
+ * Returns the number of elements in a fixed-base exponentiation table.
+ */
+int petrelic_gt_table_size(void) {
+  return petrelic_gt_windows() * ((1 << PETRELIC_GT_DEPTH) - 1);
+}
+
+/*
+ * Builds the table t[i][j - 1] = p^(j * 2^(i * PETRELIC_GT_DEPTH)) used by
+ * petrelic_gt_exp_fix.
+ */
+void petrelic_gt_exp_pre(gt_t *t, gt_t p) {
+  int i, j, w = (1 << PETRELIC_GT_DEPTH) - 1, l = petrelic_gt_windows();
+  gt_t b;
+
+  gt_null(b);
+  gt_new(b);
+  gt_copy(b, p);
+
+  for (i = 0; i < l; i++) {
+    gt_copy(t[i * w], b);
+    for (j = 1; j < w; j++) {
+      gt_mul(t[i * w + j], t[i * w + j - 1], b);
+    }
+    for (j = 0; j < PETRELIC_GT_DEPTH; j++) {
+      fp12_sqr_cyc(b, b);
+    }
+  }
+
+  gt_free(b);
+}
+
+/*
+ * Computes r = p^k using a table built by petrelic_gt_exp_pre, so that only
+ * one multiplication per window is needed and no squarings at all.
+ */
+void petrelic_gt_exp_fix(gt_t r, gt_t *t, bn_t k) {
+  int i, j, d, w = (1 << PETRELIC_GT_DEPTH) - 1, l = petrelic_gt_windows();
+  int one = 1;
+
+  if (bn_sign(k) == RLC_NEG || bn_bits(k) > l * PETRELIC_GT_DEPTH) {
+    /* The first entry of the table is the base itself. */
+    gt_exp(r, t[0], k);
+    return;
+  }
+
+  gt_set_unity(r);
+  for (i = 0; i < l; i++) {
+    d = 0;
+    for (j = PETRELIC_GT_DEPTH - 1; j >= 0; j--) {
+      d = (d << 1) | bn_get_bit(k, i * PETRELIC_GT_DEPTH + j);
+    }
+    if (d != 0) {
+      petrelic_gt_mul_acc(r, t[i * w + d - 1], &one);
+    }
+  }
+}
+
+/*
+ * Computes r = e(p[0], q[0]) * ... * e(p[n-1], q[n-1]). The Miller loops are
+ * evaluated together and share a single final exponentiation.
+ *
+ * Pairs involving the point at infinity are dropped, and the remaining points
+ * are normalized together, which costs one inversion per group instead of one
+ * per point. The points in p and q are used as scratch space.
+ */
+void petrelic_pc_map_sim(gt_t r, g1_t *p, g2_t *q, int n) {
+  int i, m = 0;
+
+  for (i = 0; i < n; i++) {
+    if (!g1_is_infty(p[i]) && !g2_is_infty(q[i])) {
+      if (m != i) {
+        g1_copy(p[m], p[i]);
+        g2_copy(q[m], q[i]);
+      }
+      m++;
+    }
+  }
+
+  if (m == 0) {
+    gt_set_unity(r);
+    return;
+  }
+  g1_norm_sim(p, p, m);
+  g2_norm_sim(q, q, m);
+  pc_map_sim(r, p, q, m);
+}
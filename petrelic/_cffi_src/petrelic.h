@@ -11,6 +11,8 @@ const int CONST_RLC_NE;
 const int CONST_RLC_GT;
 const int CONST_RLC_DIG;
 const int CONST_RLC_OK;
+const int CONST_RLC_G1_TABLE;
+const int CONST_RLC_G2_TABLE;
 
 
 
@@ -80,6 +82,8 @@ void bn_div_rem(bn_t c, bn_t d, const bn_t a, const bn_t b);
 
 void bn_mod_2b(bn_t c, const bn_t a, int b);
 void bn_mod(bn_t c, const bn_t a, const bn_t m);
+void bn_mod_pre_barrt(bn_t u, const bn_t m);
+void bn_mod_barrt(bn_t c, const bn_t a, const bn_t m, const bn_t u);
 
 void bn_gcd(bn_t c, const bn_t a, const bn_t b);
 void bn_gcd_ext(bn_t c, bn_t d, bn_t e, const bn_t a, const bn_t b);
@@ -89,6 +93,16 @@ void bn_gen_prime(bn_t a, int bits);
 void bn_gen_prime_safep(bn_t a, int bits);
 void bn_gen_prime_stron(bn_t a, int bits);
 
+// Modular arithmetic, implemented in petrelic.c
+void petrelic_bn_mod_add(bn_t r, bn_t a, bn_t b, bn_t m);
+void petrelic_bn_mod_sub(bn_t r, bn_t a, bn_t b, bn_t m);
+void petrelic_bn_mod_mul(bn_t r, bn_t a, bn_t b, bn_t m);
+void petrelic_bn_mod_barrt(bn_t r, bn_t k, bn_t m, bn_t u);
+
+// Exponentiation, implemented in petrelic.c
+void petrelic_bn_pow(bn_t r, bn_t a, bn_t b);
+void petrelic_bn_mxp(bn_t r, bn_t a, bn_t b, bn_t m);
+
 
 // HACK: rlc_align removed, hardcoded size of array
 // ORIG: typedef rlc_align dig_t fp_t[RLC_FP_DIGS + RLC_PAD(RLC_FP_BYTES)/(RLC_DIG / 8)];
@@ -170,17 +184,13 @@ void g1_mul_gen(g1_t r, bn_t k);
 int g1_is_valid(g1_t p);
 
 void g1_mul_sim(g1_t r, const g1_t p, const bn_t k, const g1_t q, const bn_t m);
+void g1_mul_sim_gen(g1_t r, bn_t k, g1_t q, bn_t m);
 void g1_map(g1_t p, const uint8_t *bin, int len);
 
-/*
-// Skipping precomputation table for now
 void g1_mul_pre(g1_t *t, const g1_t p);
 void g1_mul_fix(g1_t r, const g1_t *t, const bn_t k);
 
 
-*/
-
-
 
 /*
  * ******** Operations for G2 ********
@@ -211,8 +221,12 @@ void g2_mul_gen(g2_t r, bn_t k);
 int g2_is_valid(g2_t p);
 
 void g2_mul_sim(g2_t r, g2_t p, bn_t k, g2_t q, bn_t m);
+void g2_mul_sim_gen(g2_t r, bn_t k, g2_t q, bn_t m);
 void g2_map(g2_t p, const uint8_t *bin, int len);
 
+void g2_mul_pre(g2_t *t, const g2_t p);
+void g2_mul_fix(g2_t r, const g2_t *t, const bn_t k);
+
 
 /*
  * ******** Operations for GT ********
@@ -236,10 +250,51 @@ void gt_inv(gt_t r, gt_t p); //
 void gt_mul(gt_t r, gt_t p, gt_t q);
 // void gt_div(gt_t r, gt_t p, gt_t q);
 void gt_sqr(gt_t r, gt_t p);
+void fp12_sqr_cyc(fp12_t c, fp12_t a);
 void gt_exp(gt_t r, gt_t p, bn_t k);
 void gt_exp_dig(gt_t r, gt_t p, dig_t k);
 int gt_is_valid(gt_t p);
 
+// Element initialization, implemented in petrelic.c
+void petrelic_g1_init(g1_t p);
+void petrelic_g2_init(g2_t p);
+void petrelic_gt_init(gt_t p);
+
+// Scalar multiplication, implemented in petrelic.c
+void petrelic_g1_mul(g1_t r, g1_t p, bn_t k);
+void petrelic_g2_mul(g2_t r, g2_t p, bn_t k);
+void petrelic_g1_mul_monty(g1_t r, g1_t p, bn_t k);
+void petrelic_g2_mul_monty(g2_t r, g2_t p, bn_t k);
+
+// Serialization, implemented in petrelic.c
+int petrelic_g1_size_bin(g1_t p, int pack);
+int petrelic_g2_size_bin(g2_t p, int pack);
+int petrelic_gt_size_bin(gt_t p, int pack);
+
+// Division in GT, implemented in petrelic.c
+void petrelic_gt_div(gt_t r, gt_t a, gt_t b);
+
+// Batch operations, implemented in petrelic.c
+void petrelic_g1_map_lot(g1_st **r, const char **bin, const int *len, int n);
+void petrelic_g2_map_lot(g2_st **r, const char **bin, const int *len, int n);
+void petrelic_g1_mul_lot(g1_st **r, g1_st **p, bn_st **k, int n);
+void petrelic_g2_mul_lot(g2_st **r, g2_st **p, bn_st **k, int n);
+void petrelic_g1_add_lot(g1_t r, g1_t *t, g1_st **p, int n);
+void petrelic_g2_add_lot(g2_t r, g2_t *t, g2_st **p, int n);
+void petrelic_g1_mul_sim_lot(g1_t r, g1_t *p, bn_t *k, int n);
+void petrelic_g2_mul_sim_lot(g2_t r, g2_t *p, bn_t *k, int n);
+void petrelic_g1_wsum(g1_t r, g1_st **p, bn_st **k, int n);
+void petrelic_g2_wsum(g2_t r, g2_st **p, bn_st **k, int n);
+void petrelic_gt_exp(gt_t r, gt_t a, bn_t k);
+void petrelic_gt_exp_lot(fp6_t **r, fp6_t **a, bn_st **k, int n);
+void petrelic_gt_exp_sim_lot(gt_t r, gt_t *a, bn_t *b, int n);
+void petrelic_gt_wprod(gt_t r, fp6_t **a, bn_st **k, int n);
+void petrelic_gt_mul_lot(gt_t r, gt_t *t, fp6_t **a, int n);
+int petrelic_gt_table_size(void);
+void petrelic_gt_exp_pre(gt_t *t, gt_t p);
+void petrelic_gt_exp_fix(gt_t r, gt_t *t, bn_t k);
+void petrelic_pc_map_sim(gt_t r, g1_t *p, g2_t *q, int n);
+
 
 
 /*
@@ -30,6 +30,14 @@ Finally, we can use the pairing operator to verify the signature:
 >>> signature.pair(G2.generator()) == G1.hash_to_point(m).pair(pk[1])
 True
 
+Verifiers checking many such equations can instead use
+:py:meth:`BilinearGroupPair.multi_pair`, which shares one final
+exponentiation between all pairings:
+
+>>> h = G1.hash_to_point(m)
+>>> BilinearGroupPair().multi_pair([signature, -h], [G2.generator(), pk[1]]) == GT.neutral_element()
+True
+
 Indeed, the pairing operator is bilinear. For example:
 
 >>> a, b = 13, 29
@@ -54,6 +62,8 @@ class BilinearGroupPair:
     Contains two origin groups G1, G2 and the image group GT.
     """
 
+    __slots__ = ("G1", "G2", "GT")
+
     def __init__(self):
         """Initialise a bilinear group pair."""
         self.GT = GT()
@@ -66,10 +76,34 @@ class BilinearGroupPair:
         """
         return self.G1, self.G2, self.GT
 
+    multi_pair = native.copy_method(native.BilinearGroupPair.multi_pair, "multi_pair")
+
+    if __doc__ is not None:
+        multi_pair.__doc__ = """Returns the sum of the pairings of the elements of G1 with
+        the corresponding elements of G2.
+
+        The Miller loops share a single final exponentiation, which is much
+        faster than adding the pairings one by one.
+
+        If scalars are given, the element of G1 in each pairing is first
+        multiplied by the corresponding scalar. This is cheaper than
+        multiplying the elements of G2 or the result.
+
+        Example:
+            >>> bgp = BilinearGroupPair()
+            >>> g1, g2 = G1.generator(), G2.generator()
+            >>> bgp.multi_pair([10 * g1, g1], [g2, 5 * g2]) == 15 * g1.pair(g2)
+            True
+            >>> bgp.multi_pair([g1, g1], [g2, 5 * g2], [10, 2]) == 20 * g1.pair(g2)
+            True
+        """
+
 
 class G1(native.G1):
     """G1 group."""
 
+    __slots__ = ()
+
     @classmethod
     def _element_type(cls):
         return G1Element
@@ -78,6 +112,7 @@ class G1(native.G1):
 class G1Element(native.G1Element):
     """Element of the G1 group."""
 
+    __slots__ = ()
     group = G1
 
     def pair(self, other):
@@ -97,7 +132,7 @@ class G1Element(native.G1Element):
              >>> A.pair(g2) == g1.pair(g2) * a
              True
         """
-        if not type(other) == G2Element:
+        if other.__class__ is not G2Element and not isinstance(other, G2Element):
             raise TypeError("Second parameter should be of type G2Element is {}".format(type(other)))
 
         res = GTElement()
@@ -108,6 +143,8 @@ class G1Element(native.G1Element):
 class G2(native.G2):
     """G2 group."""
 
+    __slots__ = ()
+
     @classmethod
     def _element_type(cls):
         return G2Element
@@ -116,12 +153,15 @@ class G2(native.G2):
 class G2Element(native.G2Element):
     """Element of the G2 group."""
 
+    __slots__ = ()
     group = G2
 
 
 class GT(native._GTBase):
     """GT group."""
 
+    __slots__ = ()
+
     @classmethod
     def _element_type(cls):
         return GTElement
@@ -177,23 +217,21 @@ class GT(native._GTBase):
     def sum(cls, elems):
         """Efficient sum of a number of elements
 
-        In the current implementation this function is not optimized.
+        The sum is computed in a single call to RELIC.
 
         Example:
             >>> elems = [ x * GT.generator() for x in [10, 25, 13]]
             >>> GT.sum(elems) ==  (10 + 25 + 13) * GT.generator()
             True
         """
-        res = cls.neutral_element()
-        for el in elems:
-            res += el
-        return res
+        return cls._prod(elems)
 
     @classmethod
     def wsum(cls, weights, elems):
-        """Efficient weighted product of a number of elements
+        """Efficient weighted sum of a number of elements
 
-        In the current implementation this function is not optimized.
+        The scalar multiplications are interleaved so that all elements share
+        the same doublings.
 
         Example:
             >>> weights = [1, 2, 3]
@@ -201,11 +239,26 @@ class GT(native._GTBase):
             >>> GT.wsum(weights, elems) ==  (1 * 10 + 2 * 25 + 3 * 13) * GT.generator()
             True
         """
-        res = cls.neutral_element()
-        for w, el in zip(weights, elems):
-            res += w * el
+        # Like w * el, accept the weights and the elements in either order
+        weights, elems = list(weights), list(elems)
+        if weights and isinstance(weights[0], GTElement):
+            weights, elems = elems, weights
 
-        return res
+        return cls._wprod(weights, elems)
+
+    @classmethod
+    def mul_batch(cls, scalars, elems):
+        """Multiply each element by the corresponding scalar
+
+        All multiplications are done in a single call to RELIC.
+
+        Example:
+            >>> scalars = [10, 25, 13]
+            >>> elems = [GT.generator()] * 3
+            >>> GT.mul_batch(scalars, elems) == [k * GT.generator() for k in scalars]
+            True
+        """
+        return cls._exp_batch(scalars, elems)
 
     #
     # Aliases
@@ -224,6 +277,7 @@ class GT(native._GTBase):
 class GTElement(native._GTElementBase):
     """GT element."""
 
+    __slots__ = ()
     group = GT
 
     #
@@ -231,49 +285,37 @@ class GTElement(native._GTElementBase):
     #
 
 
-    def double(self):
-        return native.GTElement.square(self)
-
-    def idouble(self):
-        return native.GTElement.isquare(self)
+    double = native.copy_method(native.GTElement.square, "double")
+    idouble = native.copy_method(native.GTElement.isquare, "idouble")
+    double_into = native.copy_method(native.GTElement.square_into, "double_into")
 
     #
     # Binary operators
     #
 
-    def __add__(self, other):
-        return native.GTElement.__mul__(self, other)
-
-    def __iadd__(self, other):
-        return native.GTElement.__imul__(self, other)
-
-    def __sub__(self, other):
-        return native.GTElement.__truediv__(self, other)
-
-    def __isub__(self, other):
-        return native.GTElement.__itruediv__(self, other)
-
-    def __mul__(self, other):
-        return native.GTElement.__pow__(self, other)
-
-    def __imul__(self, other):
-        return native.GTElement.__ipow__(self, other)
-
-    def __rmul__(self, other):
-        return native.GTElement.__pow__(self, other)
-
-    # Copy documentation from native.G1Element
-    double.__doc__ = native.G1Element.double.__doc__.replace("G1", "GT")
-    idouble.__doc__ = native.G1Element.idouble.__doc__.replace("G1", "GT")
-
-    __add__.__doc__ = native.G1Element.__add__.__doc__.replace("G1", "GT")
-    __iadd__.__doc__ = native.G1Element.__iadd__.__doc__.replace("G1", "GT")
-
-    __sub__.__doc__ = native.G1Element.__sub__.__doc__.replace("G1", "GT")
-    __isub__.__doc__ = native.G1Element.__isub__.__doc__.replace("G1", "GT")
-
-    __mul__.__doc__ = native.G1Element.__mul__.__doc__.replace("G1", "GT")
-    __imul__.__doc__ = native.G1Element.__imul__.__doc__.replace("G1", "GT")
+    __add__ = native.copy_method(native.GTElement.__mul__, "__add__")
+    __iadd__ = native.copy_method(native.GTElement.__imul__, "__iadd__")
+    __sub__ = native.copy_method(native.GTElement.__truediv__, "__sub__")
+    __isub__ = native.copy_method(native.GTElement.__itruediv__, "__isub__")
+    __mul__ = native.copy_method(native.GTElement.__pow__, "__mul__")
+    __imul__ = native.copy_method(native.GTElement.__ipow__, "__imul__")
+    __rmul__ = native.copy_method(native.GTElement.__pow__, "__rmul__")
+
+    # Copy documentation from native.G1Element, unless docstrings are stripped (python -OO)
+    if __doc__ is not None:
+        double.__doc__ = native.G1Element.double.__doc__.replace("G1", "GT")
+        idouble.__doc__ = native.G1Element.idouble.__doc__.replace("G1", "GT")
+        double_into.__doc__ = native.G1Element.double_into.__doc__.replace("G1", "GT")
+
+        __add__.__doc__ = native.G1Element.__add__.__doc__.replace("G1", "GT")
+        __iadd__.__doc__ = native.G1Element.__iadd__.__doc__.replace("G1", "GT")
+
+        __sub__.__doc__ = native.G1Element.__sub__.__doc__.replace("G1", "GT")
+        __isub__.__doc__ = native.G1Element.__isub__.__doc__.replace("G1", "GT")
+
+        __mul__.__doc__ = native.G1Element.__mul__.__doc__.replace("G1", "GT")
+        __imul__.__doc__ = native.G1Element.__imul__.__doc__.replace("G1", "GT")
+        __rmul__.__doc__ = __mul__.__doc__
 
     #
     # Aliases
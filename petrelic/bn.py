@@ -2,7 +2,6 @@ from petrelic.bindings import _FFI, _C
 import petrelic.constants as consts
 
 import functools
-import re
 
 
 def force_Bn(n):
@@ -30,12 +29,53 @@ def force_Bn(n):
 
 
 def force_Bn_other(func):
-    return force_Bn(1)(func)
+    """A decorator that coerces the second input to be a Big Number
+
+    Specialized version of force_Bn(1) that skips all conversion work when the
+    argument already is a Bn.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if args and type(args[0]) is not Bn:
+            other = _coerce_Bn(args[0])
+            if other is NotImplemented:
+                # Don't know how to convert
+                return NotImplemented
+            args = (other,) + args[1:]
+
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=256)
+def _small_Bn(num):
+    """Return a shared Bn for a single-digit int, such as a common weight
+
+    Bn objects are never modified in place, so the same instance can serve
+    every conversion of the same int.
+    """
+    return Bn(num)
+
+
+def _coerce_Bn(num):
+    """Coerce num to a Bn, or return NotImplemented if that is not possible
+
+    Single-digit ints share a cached Bn.
+    """
+    if isinstance(num, int):
+        if -consts.DIGIT_MAXIMUM < num < consts.DIGIT_MAXIMUM:
+            return _small_Bn(num)
+        return Bn(num)
+    if isinstance(num, Bn):
+        return num
+    return NotImplemented
 
 
 class Bn(object):
 
-    __slots__ = ["bn"]
+    __slots__ = ["bn", "_hash"]
 
     @staticmethod
     def from_num(num):
@@ -79,7 +119,8 @@ class Bn(object):
             '100'
         """
 
-        if not re.match("-?[0-9]+$", sdec):
+        digits = sdec[1:] if sdec.startswith("-") else sdec
+        if not digits or digits.strip("0123456789"):
             raise Exception("String must only contain digits 0--9 and sign")
 
         return Bn._from_radix_string(sdec, 10)
@@ -99,11 +140,17 @@ class Bn(object):
             Bn(255)
         """
 
-        if not re.match("-?[0-9a-fA-F]+$", shex):
+        neg = shex.startswith("-")
+        digits = shex[1:] if neg else shex
+        if not digits or digits.strip("0123456789abcdefABCDEF"):
             raise Exception("String must only contain digits 0--9,a--f and sign")
 
-        shex = shex.lower()
-        return Bn._from_radix_string(shex, 16)
+        if len(digits) % 2 == 1:
+            digits = "0" + digits
+        ret = Bn.from_binary(bytes.fromhex(digits))
+        if neg:
+            return ret.__neg__()
+        return ret
 
     @staticmethod
     def from_binary(sbin):
@@ -114,6 +161,9 @@ class Bn(object):
         byte sequence, and the library user should store the sign bit
         separately.
 
+        Other buffers, such as a bytearray or a memoryview, are read in place
+        without being copied to a bytes object first.
+
         Args:
             sbin (string): a byte sequence.
 
@@ -124,8 +174,12 @@ class Bn(object):
             Bn(66051)
             >>> (1 * 256**2) + (2 * 256) + 3
             66051
+            >>> Bn.from_binary(bytearray(byte_seq))
+            Bn(66051)
         """
         ret = Bn()
+        if type(sbin) is not bytes:
+            sbin = _FFI.from_buffer(sbin)
         _C.bn_read_bin(ret.bn, sbin, len(sbin))
         return ret
 
@@ -170,12 +224,17 @@ class Bn(object):
         self.bn = _FFI.new("bn_t")
         _C.bn_new(self.bn)
 
-        if abs(num) < consts.DIGIT_MAXIMUM:
-            _C.bn_set_dig(self.bn, abs(num))
+        # bn_new already sets the number to zero
+        if not num:
+            return
+
+        mag = -num if num < 0 else num
+        if mag < consts.DIGIT_MAXIMUM:
+            _C.bn_set_dig(self.bn, mag)
         else:
-            length = num.bit_length() // 8 + 1
-            sbin = abs(num).to_bytes(length, byteorder='big', signed=False)
-            _C.bn_read_bin(self.bn, sbin, len(sbin))
+            length = (mag.bit_length() + 7) // 8
+            sbin = mag.to_bytes(length, byteorder='big', signed=False)
+            _C.bn_read_bin(self.bn, sbin, length)
 
         if num < 0:
             _C.bn_neg(self.bn, self.bn)
@@ -253,7 +312,13 @@ class Bn(object):
         return self.__int__()
 
     def __int__(self):
-        return int(self.repr_in_base(10))
+        length = _C.bn_size_bin(self.bn)
+        buf = bytearray(length)
+        _C.bn_write_bin(_FFI.from_buffer(buf), length, self.bn)
+        num = int.from_bytes(buf, byteorder='big')
+        if _C.bn_sign(self.bn) == _C.CONST_RLC_NEG:
+            return -num
+        return num
 
     def __index__(self):
         return self.__int__()
@@ -292,9 +357,9 @@ class Bn(object):
             raise Exception("Cannot represent negative numbers")
 
         length = _C.bn_size_bin(self.bn)
-        buf = _FFI.new("char[]", length)
-        _C.bn_write_bin(buf, length, self.bn)
-        return _FFI.unpack(buf, length)
+        buf = bytearray(length)
+        _C.bn_write_bin(_FFI.from_buffer(buf), length, self.bn)
+        return bytes(buf)
 
     def repr_in_base(self, radix):
         """ Represent number as string in given base
@@ -309,9 +374,10 @@ class Bn(object):
             '-10000000000'
         """
         length = _C.bn_size_str(self.bn, radix)
-        buf = _FFI.new("char[]", length)
-        _C.bn_write_str(buf, length, self.bn, radix)
-        return _FFI.string(buf).decode("utf8")
+        buf = bytearray(length)
+        _C.bn_write_str(_FFI.from_buffer(buf), length, self.bn, radix)
+        # The length accounts for the terminating NUL byte
+        return buf[:buf.find(0)].decode("utf8")
 
     def test(self):
         """
@@ -442,8 +508,7 @@ class Bn(object):
         """
 
         r = Bn()
-        _C.bn_add(r.bn, self.bn, other.bn)
-        _C.bn_mod(r.bn, r.bn, m.bn)
+        _C.petrelic_bn_mod_add(r.bn, self.bn, other.bn, m.bn)
         return r
 
     @force_Bn(1)
@@ -457,8 +522,7 @@ class Bn(object):
         """
 
         r = Bn()
-        _C.bn_sub(r.bn, self.bn, other.bn)
-        _C.bn_mod(r.bn, r.bn, m.bn)
+        _C.petrelic_bn_mod_sub(r.bn, self.bn, other.bn, m.bn)
         return r
 
     @force_Bn(1)
@@ -472,8 +536,7 @@ class Bn(object):
         """
 
         r = Bn()
-        _C.bn_mul(r.bn, self.bn, other.bn)
-        _C.bn_mod(r.bn, r.bn, m.bn)
+        _C.petrelic_bn_mod_mul(r.bn, self.bn, other.bn, m.bn)
         return r
 
     @force_Bn_other
@@ -605,34 +668,19 @@ class Bn(object):
         if type(modulo) == int:
             modulo = Bn(modulo)
 
-        base = Bn()
-        _C.bn_copy(base.bn, self.bn)
-
-        if _C.bn_sign(n.bn) == _C.CONST_RLC_NEG:
-            base = base.mod_inverse(modulo)
-            _C.bn_neg(n.bn, n.bn)
-
         if _C.bn_is_zero(n.bn) == 1:
             return Bn(1)
 
-        res = Bn(1)
+        res = Bn()
         if modulo is None:
-            while not bool(_C.bn_is_zero(n.bn)):
-                if n.is_odd():
-                    res = res * base
-
-                _C.bn_sqr(base.bn, base.bn)
-                _C.bn_hlv(n.bn, n.bn)
-            return res
+            _C.petrelic_bn_pow(res.bn, self.bn, n.bn)
         else:
-            # TODO: rewrite using bn_mxp
-            while not bool(_C.bn_is_zero(n.bn)):
-                if n.is_odd():
-                    res = res.mod_mul(base, modulo)
-
-                base = base.mod_mul(base, modulo)
-                _C.bn_hlv(n.bn, n.bn)
-            return res
+            base = self
+            if _C.bn_sign(n.bn) == _C.CONST_RLC_NEG:
+                base = self.mod_inverse(modulo)
+                n = -n
+            _C.petrelic_bn_mxp(res.bn, base.bn, n.bn, modulo.bn)
+        return res
 
     def is_prime(self):
         """Returns True if the number is prime, with negligible prob. of error.
@@ -689,7 +737,13 @@ class Bn(object):
         return int(_C.bn_bits(self.bn))
 
     def __hash__(self):
-        return int(self).__hash__()
+        # Numbers are never modified after construction, so the hash is
+        # computed on first use only
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = int(self).__hash__()
+            return self._hash
 
     # Aliases
     abs = __abs__
@@ -30,6 +30,14 @@ Finally, we can use the pairing operator to verify the signature:
 >>> signature.pair(G2.generator()) == G1.hash_to_point(m).pair(pk[1])
 True
 
+Verifiers checking many such equations can instead use
+:py:meth:`BilinearGroupPair.multi_pair`, which shares one final
+exponentiation between all pairings:
+
+>>> h = G1.hash_to_point(m)
+>>> BilinearGroupPair().multi_pair([signature, h.inverse()], [G2.generator(), pk[1]]) == GT.unity()
+True
+
 Indeed, the pairing operator is bilinear. For example:
 
 >>> a, b = 13, 29
@@ -54,6 +62,8 @@ class BilinearGroupPair:
     Contains two origin groups G1, G2 and the image group GT.
     """
 
+    __slots__ = ("G1", "G2", "GT")
+
     def __init__(self):
         """Initialise a bilinear group pair."""
         self.GT = GT()
@@ -66,10 +76,34 @@ class BilinearGroupPair:
         """
         return self.G1, self.G2, self.GT
 
+    multi_pair = native.copy_method(native.BilinearGroupPair.multi_pair, "multi_pair")
+
+    if __doc__ is not None:
+        multi_pair.__doc__ = """Returns the product of the pairings of the elements of G1
+        with the corresponding elements of G2.
+
+        The Miller loops share a single final exponentiation, which is much
+        faster than multiplying the pairings one by one.
+
+        If scalars are given, the element of G1 in each pairing is first
+        raised to the corresponding scalar. This is cheaper than raising the
+        elements of G2 or the result.
+
+        Example:
+            >>> bgp = BilinearGroupPair()
+            >>> g1, g2 = G1.generator(), G2.generator()
+            >>> bgp.multi_pair([g1 ** 10, g1], [g2, g2 ** 5]) == g1.pair(g2) ** 15
+            True
+            >>> bgp.multi_pair([g1, g1], [g2, g2 ** 5], [10, 2]) == g1.pair(g2) ** 20
+            True
+        """
+
 
 class G1(native._G1Base):
     """G1 group."""
 
+    __slots__ = ()
+
     @classmethod
     def _element_type(cls):
         return G1Element
@@ -125,23 +159,21 @@ class G1(native._G1Base):
     def prod(cls, elems):
         """Efficient product of a number of elements
 
-        In the current implementation this function is not optimized.
+        The product is computed in a single call to RELIC.
 
         Example:
             >>> elems = [ G1.generator() ** x for x in [10, 25, 13]]
             >>> G1.prod(elems) ==  G1.generator() ** (10 + 25 + 13)
             True
         """
-        res = cls.neutral_element()
-        for el in elems:
-            res *= el
-        return res
+        return cls._sum(elems)
 
     @classmethod
     def wprod(cls, weights, elems):
         """Efficient weighted product of a number of elements
 
-        In the current implementation this function is not optimized.
+        The exponentiations are interleaved so that all elements share the
+        same squarings.
 
         Example:
             >>> weights = [1, 2, 3]
@@ -149,11 +181,21 @@ class G1(native._G1Base):
             >>> G1.wprod(weights, elems) ==  G1.generator() ** (1 * 10 + 2 * 25 + 3 * 13)
             True
         """
-        res = cls.neutral_element()
-        for w, el in zip(weights, elems):
-            res *= el ** w
+        return cls._wsum(weights, elems)
 
-        return res
+    @classmethod
+    def pow_batch(cls, exponents, elems):
+        """Raise each element to the corresponding exponent
+
+        All exponentiations are done in a single call to RELIC.
+
+        Example:
+            >>> exponents = [10, 25, 13]
+            >>> elems = [G1.generator()] * 3
+            >>> G1.pow_batch(exponents, elems) == [G1.generator() ** k for k in exponents]
+            True
+        """
+        return cls._mul_batch(exponents, elems)
 
     #
     # Aliases
@@ -171,6 +213,7 @@ class G1(native._G1Base):
 class G1Element(native._G1ElementBase):
     """Element of the G1 group."""
 
+    __slots__ = ()
     group = G1
 
     def pair(self, other):
@@ -190,7 +233,7 @@ class G1Element(native._G1ElementBase):
              >>> A.pair(g2) == g1.pair(g2) ** a
              True
         """
-        if not type(other) == G2Element:
+        if other.__class__ is not G2Element and not isinstance(other, G2Element):
             raise TypeError("Second parameter should be of type G2Element is {}".format(type(other)))
 
         res = GTElement()
@@ -201,46 +244,47 @@ class G1Element(native._G1ElementBase):
     # Unary operators
     #
 
-    def square(self):
-        return native.G1Element.double(self)
-
-    def isquare(self):
-        return native.G1Element.idouble(self)
+    square = native.copy_method(native.G1Element.double, "square")
+    isquare = native.copy_method(native.G1Element.idouble, "isquare")
+    square_into = native.copy_method(native.G1Element.double_into, "square_into")
 
     #
     # Binary operators
     #
 
-    def __mul__(self, other):
-        return native.G1Element.__add__(self, other)
-
-    def __imul__(self, other):
-        return native.G1Element.__iadd__(self, other)
-
-    def __truediv__(self, other):
-        return native.G1Element.__sub__(self, other)
+    __mul__ = native.copy_method(native.G1Element.__add__, "__mul__")
+    __imul__ = native.copy_method(native.G1Element.__iadd__, "__imul__")
+    __truediv__ = native.copy_method(native.G1Element.__sub__, "__truediv__")
+    __itruediv__ = native.copy_method(native.G1Element.__isub__, "__itruediv__")
+    __pow__ = native.copy_method(native.G1Element.__mul__, "__pow__")
+    __ipow__ = native.copy_method(native.G1Element.__imul__, "__ipow__")
+    pow_secret = native.copy_method(native.G1Element.mul_secret, "pow_secret")
 
-    def __itruediv__(self, other):
-        return native.G1Element.__isub__(self, other)
+    # Copy documentation from native.GTElement, unless docstrings are stripped (python -OO)
+    if __doc__ is not None:
+        square.__doc__ = native.GTElement.square.__doc__.replace("GT", "G1")
+        isquare.__doc__ = native.GTElement.isquare.__doc__.replace("GT", "G1")
+        square_into.__doc__ = native.GTElement.square_into.__doc__.replace("GT", "G1")
 
-    def __pow__(self, other):
-        return native.G1Element.__mul__(self, other)
+        __mul__.__doc__ = native.GTElement.__mul__.__doc__.replace("GT", "G1")
+        __imul__.__doc__ = native.GTElement.__imul__.__doc__.replace("GT", "G1")
 
-    def __ipow__(self, other):
-        return native.G1Element.__imul__(self, other)
+        __truediv__.__doc__ = native.GTElement.__truediv__.__doc__.replace("GT", "G1")
+        __itruediv__.__doc__ = native.GTElement.__itruediv__.__doc__.replace("GT", "G1")
 
-    # Copy documentation from native.GTElement
-    square.__doc__ = native.GTElement.square.__doc__.replace("GT", "G1")
-    isquare.__doc__ = native.GTElement.isquare.__doc__.replace("GT", "G1")
+        __pow__.__doc__ = native.GTElement.__pow__.__doc__.replace("GT", "G1")
+        __ipow__.__doc__ = native.GTElement.__ipow__.__doc__.replace("GT", "G1")
 
-    __mul__.__doc__ = native.GTElement.__mul__.__doc__.replace("GT", "G1")
-    __imul__.__doc__ = native.GTElement.__imul__.__doc__.replace("GT", "G1")
+        pow_secret.__doc__ = """Raise element to a secret exponent
 
-    __truediv__.__doc__ = native.GTElement.__truediv__.__doc__.replace("GT", "G1")
-    __itruediv__.__doc__ = native.GTElement.__itruediv__.__doc__.replace("GT", "G1")
+        Uses a Montgomery ladder, whose sequence of operations does not depend
+        on the bits of the exponent. Prefer it to `el ** n` for secret keys.
 
-    __pow__.__doc__ = native.GTElement.__pow__.__doc__.replace("GT", "G1")
-    __ipow__.__doc__ = native.GTElement.__ipow__.__doc__.replace("GT", "G1")
+        Examples:
+            >>> g = G1.generator()
+            >>> g.pow_secret(10) == g ** 10
+            True
+        """
 
     #
     # Aliases
@@ -258,6 +302,8 @@ class G1Element(native._G1ElementBase):
 
 class G2(native._G2Base):
 
+    __slots__ = ()
+
     @classmethod
     def _element_type(cls):
         return G2Element
@@ -266,23 +312,21 @@ class G2(native._G2Base):
     def prod(cls, elems):
         """Efficient product of a number of elements
 
-        In the current implementation this function is not optimized.
+        The product is computed in a single call to RELIC.
 
         Example:
             >>> elems = [ G2.generator() ** x for x in [10, 25, 13]]
             >>> G2.prod(elems) ==  G2.generator() ** (10 + 25 + 13)
             True
         """
-        res = cls.neutral_element()
-        for el in elems:
-            res *= el
-        return res
+        return cls._sum(elems)
 
     @classmethod
     def wprod(cls, weights, elems):
         """Efficient weighted product of a number of elements
 
-        In the current implementation this function is not optimized.
+        The exponentiations are interleaved so that all elements share the
+        same squarings.
 
         Example:
             >>> weights = [1, 2, 3]
@@ -290,11 +334,21 @@ class G2(native._G2Base):
             >>> G2.wprod(weights, elems) ==  G2.generator() ** (1 * 10 + 2 * 25 + 3 * 13)
             True
         """
-        res = cls.neutral_element()
-        for w, el in zip(weights, elems):
-            res *= el ** w
+        return cls._wsum(weights, elems)
 
-        return res
+    @classmethod
+    def pow_batch(cls, exponents, elems):
+        """Raise each element to the corresponding exponent
+
+        All exponentiations are done in a single call to RELIC.
+
+        Example:
+            >>> exponents = [10, 25, 13]
+            >>> elems = [G2.generator()] * 3
+            >>> G2.pow_batch(exponents, elems) == [G2.generator() ** k for k in exponents]
+            True
+        """
+        return cls._mul_batch(exponents, elems)
 
     #
     # Aliases
@@ -312,52 +366,45 @@ class G2(native._G2Base):
 class G2Element(native._G2ElementBase):
     """Element of the G2 group."""
 
+    __slots__ = ()
     group = G2
 
     #
     # Unary operators
     #
 
-    def square(self):
-        return native.G2Element.double(self)
-
-    def isquare(self):
-        return native.G2Element.idouble(self)
+    square = native.copy_method(native.G2Element.double, "square")
+    isquare = native.copy_method(native.G2Element.idouble, "isquare")
+    square_into = native.copy_method(native.G2Element.double_into, "square_into")
 
     #
     # Binary operators
     #
 
-    def __mul__(self, other):
-        return native.G2Element.__add__(self, other)
+    __mul__ = native.copy_method(native.G2Element.__add__, "__mul__")
+    __imul__ = native.copy_method(native.G2Element.__iadd__, "__imul__")
+    __truediv__ = native.copy_method(native.G2Element.__sub__, "__truediv__")
+    __itruediv__ = native.copy_method(native.G2Element.__isub__, "__itruediv__")
+    __pow__ = native.copy_method(native.G2Element.__mul__, "__pow__")
+    __ipow__ = native.copy_method(native.G2Element.__imul__, "__ipow__")
+    pow_secret = native.copy_method(native.G2Element.mul_secret, "pow_secret")
 
-    def __imul__(self, other):
-        return native.G2Element.__iadd__(self, other)
+    # Copy documentation from native.GTElement, unless docstrings are stripped (python -OO)
+    if __doc__ is not None:
+        square.__doc__ = native.GTElement.square.__doc__.replace("GT", "G2")
+        isquare.__doc__ = native.GTElement.isquare.__doc__.replace("GT", "G2")
+        square_into.__doc__ = native.GTElement.square_into.__doc__.replace("GT", "G2")
 
-    def __truediv__(self, other):
-        return native.G2Element.__sub__(self, other)
+        __mul__.__doc__ = native.GTElement.__mul__.__doc__.replace("GT", "G2")
+        __imul__.__doc__ = native.GTElement.__imul__.__doc__.replace("GT", "G2")
 
-    def __itruediv__(self, other):
-        return native.G2Element.__isub__(self, other)
+        __truediv__.__doc__ = native.GTElement.__truediv__.__doc__.replace("GT", "G2")
+        __itruediv__.__doc__ = native.GTElement.__itruediv__.__doc__.replace("GT", "G2")
 
-    def __pow__(self, other):
-        return native.G2Element.__mul__(self, other)
+        __pow__.__doc__ = native.GTElement.__pow__.__doc__.replace("GT", "G2")
+        __ipow__.__doc__ = native.GTElement.__ipow__.__doc__.replace("GT", "G2")
 
-    def __ipow__(self, other):
-        return native.G2Element.__imul__(self, other)
-
-    # Copy documentation from native.GTElement
-    square.__doc__ = native.GTElement.square.__doc__.replace("GT", "G2")
-    isquare.__doc__ = native.GTElement.isquare.__doc__.replace("GT", "G2")
-
-    __mul__.__doc__ = native.GTElement.__mul__.__doc__.replace("GT", "G2")
-    __imul__.__doc__ = native.GTElement.__imul__.__doc__.replace("GT", "G2")
-
-    __truediv__.__doc__ = native.GTElement.__truediv__.__doc__.replace("GT", "G2")
-    __itruediv__.__doc__ = native.GTElement.__itruediv__.__doc__.replace("GT", "G2")
-
-    __pow__.__doc__ = native.GTElement.__pow__.__doc__.replace("GT", "G2")
-    __ipow__.__doc__ = native.GTElement.__ipow__.__doc__.replace("GT", "G2")
+        pow_secret.__doc__ = G1Element.pow_secret.__doc__.replace("G1", "G2")
 
     #
     # Aliases
@@ -376,6 +423,8 @@ class G2Element(native._G2ElementBase):
 class GT(native.GT):
     """GT group."""
 
+    __slots__ = ()
+
     @classmethod
     def _element_type(cls):
         return GTElement
@@ -384,5 +433,6 @@ class GT(native.GT):
 class GTElement(native.GTElement):
     """GT element."""
 
+    __slots__ = ()
     group = GT
 
@@ -38,22 +38,47 @@ True
 
 """
 
-import functools
+import sys
+import types
 
 from petrelic.bindings import _FFI, _C
-from petrelic.bn import Bn, force_Bn_other
+from petrelic.bn import Bn, _coerce_Bn
+
+_RLC_EQ = int(_C.CONST_RLC_EQ)
+# Number of elements in a fixed-base exponentiation table of GT
+_GT_TABLE_SIZE = int(_C.petrelic_gt_table_size())
+
 
 #
 # Utility function
 #
-def check_same_type(func):
-    """Enforce both arguments have same type"""
-    @functools.wraps(func)
-    def wrapper(a, b):
-        if not type(a) == type(b):
-            return NotImplemented
-        return func(a, b)
-    return wrapper
+def copy_method(func, name):
+    """Copy a method under a new name
+
+    Unlike a method calling func, the copy adds no Python frame to each call.
+    It also has its own docstring, which can be rewritten freely.
+
+    Call it from a class body: like collections.namedtuple, it takes the
+    module and class of the copy from the calling frame, so that doctest
+    collects the docstring in the module defining the class.
+    """
+    caller = sys._getframe(1)
+    res = types.FunctionType(func.__code__, func.__globals__, name,
+                             func.__defaults__, func.__closure__)
+    res.__kwdefaults__ = func.__kwdefaults__
+    res.__doc__ = func.__doc__
+    res.__module__ = caller.f_globals["__name__"]
+    owner = caller.f_locals.get("__qualname__")
+    res.__qualname__ = name if owner is None else "{}.{}".format(owner, name)
+    return res
+
+
+def coerce_scalars(scalars):
+    """Coerce all scalars to Bn, raising TypeError if that is not possible"""
+    res = [Bn.from_num(k) for k in scalars]
+    if any(k is NotImplemented for k in res):
+        raise TypeError("Scalars should be of type int or Bn")
+    return res
 
 
 #
@@ -72,6 +97,8 @@ class NoAffineCoordinateForECPoint(Exception):
 class BilinearGroupPair:
     """A bilinear group pair used to wrap the three groups G1, G2, GT."""
 
+    __slots__ = ("g1", "g2", "gt")
+
     def __init__(self):
         self.gt = GT()
         self.g1 = G1()
@@ -83,6 +110,45 @@ class BilinearGroupPair:
         """
         return self.g1, self.g2, self.gt
 
+    def multi_pair(self, g1_elems, g2_elems, scalars=None):
+        """
+        Returns the product of the pairings of the elements of G1 with the
+        corresponding elements of G2.
+
+        The Miller loops share a single final exponentiation, which is much
+        faster than multiplying the pairings one by one.
+
+        If scalars are given, the element of G1 in each pairing is first
+        multiplied by the corresponding scalar. This is cheaper than
+        multiplying the elements of G2 or the result.
+
+        Example:
+            >>> bgp = BilinearGroupPair()
+            >>> g1, g2 = G1.generator(), G2.generator()
+            >>> bgp.multi_pair([10 * g1, g1], [g2, 5 * g2]) == g1.pair(g2) ** 15
+            True
+            >>> bgp.multi_pair([g1, g1], [g2, 5 * g2], [10, 2]) == g1.pair(g2) ** 20
+            True
+        """
+        g1_elems, g2_elems = list(g1_elems), list(g2_elems)
+        if len(g1_elems) != len(g2_elems):
+            raise ValueError("Expected as many elements of G1 as of G2")
+        if scalars is not None:
+            scalars = list(scalars)
+            if len(scalars) != len(g1_elems):
+                raise ValueError("Expected as many scalars as elements of G1")
+
+        # Shared by all interfaces, so the types come from this pair's groups
+        g1_group, g2_group, gt_group = self.groups()
+        g1_type, g2_type = g1_group._element_type(), g2_group._element_type()
+        for p, q in zip(g1_elems, g2_elems):
+            if p.__class__ is not g1_type and not isinstance(p, g1_type):
+                raise TypeError("First parameter should be of type {} is {}".format(g1_type.__name__, type(p)))
+            if q.__class__ is not g2_type and not isinstance(q, g2_type):
+                raise TypeError("Second parameter should be of type {} is {}".format(g2_type.__name__, type(q)))
+
+        return gt_group._multi_pair(g1_elems, g2_elems, scalars)
+
 
 #
 # Group and Elements
@@ -92,6 +158,11 @@ class _G1Base(object):
     """All Base G1 methods, will be used in all interfaces
     """
 
+    __slots__ = ()
+
+    _cached_order = None
+    _cached_barrett = None
+
     @classmethod
     def _element_type(cls):
         return G1Element
@@ -111,9 +182,28 @@ class _G1Base(object):
             >>> order * generator == neutral
             True
         """
-        order = Bn()
-        _C.g1_get_ord(order.bn)
-        return order
+        return cls._order().copy()
+
+    @classmethod
+    def _order(cls):
+        """Return the cached order of the group. Callers must not modify it."""
+        if _G1Base._cached_order is None:
+            order = Bn()
+            _C.g1_get_ord(order.bn)
+            _G1Base._cached_order = order
+        return _G1Base._cached_order
+
+    @classmethod
+    def _reduce_scalar(cls, k):
+        """Reduce the scalar k modulo the group order, using Barrett reduction."""
+        order = cls._order()
+        if _G1Base._cached_barrett is None:
+            barrett = Bn()
+            _C.bn_mod_pre_barrt(barrett.bn, order.bn)
+            _G1Base._cached_barrett = barrett
+        res = Bn()
+        _C.petrelic_bn_mod_barrt(res.bn, k.bn, order.bn, _G1Base._cached_barrett.bn)
+        return res
 
     @classmethod
     def generator(cls):
@@ -159,31 +249,96 @@ class _G1Base(object):
         _C.g1_map(res.pt, hinput, len(hinput))
         return res
 
+    @classmethod
+    def hash_to_point_batch(cls, hinputs):
+        """Return the group elements obtained by hashing each of the inputs
+
+        All inputs are hashed in a single call to RELIC.
+
+        Example:
+            >>> hinputs = [b"foo", b"bar"]
+            >>> elems = G1.hash_to_point_batch(hinputs)
+            >>> elems == [G1.hash_to_point(h) for h in hinputs]
+            True
+        """
+        buffers = [_FFI.from_buffer(h) for h in hinputs]
+        res = [cls._new_element() for _ in buffers]
+        points = _FFI.new("g1_st *[]", [el.pt for el in res])
+        bins = _FFI.new("char *[]", buffers)
+        lens = _FFI.new("int[]", [len(b) for b in buffers])
+        _C.petrelic_g1_map_lot(points, bins, lens, len(res))
+        return res
+
+    @classmethod
+    def _mul_batch(cls, scalars, elems):
+        """Multiply each element by its scalar in a single call to RELIC."""
+        terms = list(zip(coerce_scalars(scalars), elems))
+        res = [cls._new_element() for _ in terms]
+        _C.petrelic_g1_mul_lot(
+            _FFI.new("g1_st *[]", [el.pt for el in res]),
+            _FFI.new("g1_st *[]", [el.pt for _, el in terms]),
+            _FFI.new("bn_st *[]", [k.bn for k, _ in terms]),
+            len(terms))
+        return res
+
+    @classmethod
+    def _sum(cls, elems):
+        """Add the elements together in a single call to RELIC."""
+        elems = list(elems)
+        res = cls._new_element()
+        _C.petrelic_g1_add_lot(
+            res.pt,
+            _FFI.new("g1_t[]", (len(elems) + 1) // 2),
+            _FFI.new("g1_st *[]", [el.pt for el in elems]),
+            len(elems))
+        return res
+
+    @classmethod
+    def _wsum(cls, weights, elems):
+        """Compute the weighted sum using a simultaneous multiplication."""
+        terms = list(zip(coerce_scalars(weights), elems))
+        if len(terms) == 2 and (terms[0][1]._is_gen or terms[1][1]._is_gen):
+            # k * generator + m * q uses RELIC's precomputed generator table
+            (k, _), (m, q) = terms if terms[0][1]._is_gen else terms[::-1]
+            # Keep the reduced scalars alive until RELIC is done with them
+            k = cls._reduce_scalar(k)
+            m = cls._reduce_scalar(m)
+            res = cls._new_element()
+            _C.g1_mul_sim_gen(res.pt, k.bn, q.pt, m.bn)
+            return res
+
+        res = cls._new_element()
+        _C.petrelic_g1_wsum(
+            res.pt,
+            _FFI.new("g1_st *[]", [el.pt for _, el in terms]),
+            _FFI.new("bn_st *[]", [w.bn for w, _ in terms]),
+            len(terms))
+        return res
+
 class G1(_G1Base):
     """The G1 group."""
 
+    __slots__ = ()
+
     @classmethod
     def sum(cls, elems):
         """Efficient sum of a number of elements
 
-        In the current implementation this function is not optimized.
+        The sum is computed in a single call to RELIC.
 
         Example:
             >>> elems = [ x * G1.generator() for x in [10, 25, 13]]
             >>> G1.sum(elems) ==  (10 + 25 + 13) * G1.generator()
             True
         """
-        res = cls.neutral_element()
-        for el in elems:
-            res += el
-
-        return res
+        return cls._sum(elems)
 
     @classmethod
     def wsum(cls, weights, elems):
-        """Efficient weighted product of a number of elements
+        """Efficient weighted sum of a number of elements
 
-        In the current implementation this function is not optimized.
+        The scalar multiplications are interleaved so that all elements share
+        the same doublings.
 
         Example:
             >>> weights = [1, 2, 3]
@@ -191,11 +346,26 @@ class G1(_G1Base):
             >>> G1.wsum(weights, elems) ==  (1 * 10 + 2 * 25 + 3 * 13) * G1.generator()
             True
         """
-        res = cls.neutral_element()
-        for w, el in zip(weights, elems):
-            res += w * el
+        # Like w * el, accept the weights and the elements in either order
+        weights, elems = list(weights), list(elems)
+        if weights and isinstance(weights[0], _G1ElementBase):
+            weights, elems = elems, weights
 
-        return res
+        return cls._wsum(weights, elems)
+
+    @classmethod
+    def mul_batch(cls, scalars, elems):
+        """Multiply each element by the corresponding scalar
+
+        All multiplications are done in a single call to RELIC.
+
+        Example:
+            >>> scalars = [10, 25, 13]
+            >>> elems = [G1.generator()] * 3
+            >>> G1.mul_batch(scalars, elems) == [k * G1.generator() for k in scalars]
+            True
+        """
+        return cls._mul_batch(scalars, elems)
 
 
     #
@@ -212,20 +382,33 @@ class G1(_G1Base):
 
 
 class _G1ElementBase(object):
+    """Internal base class for G1 elements"""
+
+    __slots__ = ("pt", "_is_gen", "_table", "_bin")
+
     def __init__(self):
         """Initialize a new element of G1."""
         self.pt = _FFI.new("g1_t")
+        _C.petrelic_g1_init(self.pt)
         self._is_gen = False
-        _C.g1_null(self.pt)
-        _C.g1_new(self.pt)
+        self._table = None
+        self._bin = None
 
     def __copy__(self):
         """Clone an element of G1."""
         copy = self.__class__()
         _C.g1_copy(copy.pt, self.pt)
         copy._is_gen = self._is_gen
+        copy._table = self._table
+        copy._bin = self._bin
         return copy
 
+    def _invalidate(self):
+        """Drop the generator flag, table and encoding after a modification."""
+        self._is_gen = False
+        self._table = None
+        self._bin = None
+
     #
     # Misc
     #
@@ -277,6 +460,22 @@ class _G1ElementBase(object):
 
         return x, y
 
+    def precompute(self):
+        """Precompute a table to speed up scalar multiplications of this element.
+
+        This pays off when the same element is multiplied by many scalars. The
+        table is discarded when the element is modified in place.
+
+        Example:
+            >>> elem = G1.hash_to_point(b"foo")
+            >>> _ = elem.precompute()
+            >>> 42 * elem == 42 * G1.hash_to_point(b"foo")
+            True
+        """
+        self._table = _FFI.new("g1_t[]", _C.CONST_RLC_G1_TABLE)
+        _C.g1_mul_pre(self._table, self.pt)
+        return self
+
     def pair(self, other):
         """Pair element with another element in G2
 
@@ -295,20 +494,51 @@ class _G1ElementBase(object):
              >>> A.pair(g2) == g1.pair(g2) ** a
              True
         """
-        if not type(other) == G2Element:
+        if other.__class__ is not G2Element and not isinstance(other, G2Element):
             raise TypeError("Second parameter should be of type G2Element is {}".format(type(other)))
 
         res = GTElement()
         _C.pc_map(res.pt, self.pt, other.pt)
         return res
 
+    def pair_into(self, other, out):
+        """Store the pairing of the current element with another element in G2 in out.
+
+        This avoids allocating a new element, which helps in tight loops. It is
+        shared by all interfaces, so other and out may be G2 and GT elements of
+        any interface.
+
+        Example:
+            >>> g1, g2 = G1.generator(), G2.generator()
+            >>> a, b = 10, 50
+            >>> A, B = a * g1, b * g2
+            >>> out = GT.neutral_element()
+            >>> _ = A.pair_into(B, out)
+            >>> out == g1.pair(g2) ** (a * b)
+            True
+        """
+        if not isinstance(other, _G2ElementBase):
+            raise TypeError("Second parameter should be of type G2Element is {}".format(type(other)))
+        if not isinstance(out, _GTElementBase):
+            raise TypeError("Output parameter should be of type GTElement is {}".format(type(out)))
+
+        out._invalidate()
+        _C.pc_map(out.pt, self.pt, other.pt)
+        return out
+
+    def _cached_binary(self):
+        """The compressed encoding, kept until the element is modified."""
+        if self._bin is None:
+            self._bin = self.to_binary()
+        return self._bin
+
     def __hash__(self):
         """Hash function used internally by Python."""
-        return self.to_binary().__hash__()
+        return self._cached_binary().__hash__()
 
     def __repr__(self):
         """String representation of the element of G1."""
-        pt_hex = self.to_binary().hex()
+        pt_hex = self._cached_binary().hex()
         return 'G1Element({})'.format(pt_hex)
 
     #
@@ -342,10 +572,10 @@ class _G1ElementBase(object):
             True
         """
         flag = 1 if compressed else 0
-        length = _C.g1_size_bin(self.pt, flag)
-        buf = _FFI.new("char[]", length)
-        _C.g1_write_bin(buf, length, self.pt, flag)
-        return _FFI.unpack(buf, length)
+        length = _C.petrelic_g1_size_bin(self.pt, flag)
+        buf = bytearray(length)
+        _C.g1_write_bin(_FFI.from_buffer(buf), length, self.pt, flag)
+        return bytes(buf)
 
     #
     # Unary operators
@@ -377,6 +607,7 @@ class _G1ElementBase(object):
             >>> elem1 == elem2.inverse()
             True
         """
+        self._invalidate()
         _C.g1_neg(self.pt, self.pt)
         return self
 
@@ -387,17 +618,17 @@ class _G1ElementBase(object):
 
     def __eq__(self, other):
         """Check point equality."""
-        if not isinstance(other, self.__class__):
+        if other.__class__ is not self.__class__ and not isinstance(other, self.__class__):
             return False
 
-        return _C.g1_cmp(self.pt, other.pt) == _C.CONST_RLC_EQ
+        return _C.g1_cmp(self.pt, other.pt) == _RLC_EQ
 
     def __ne__(self, other):
         """Check that the points are different."""
-        if not isinstance(other, self.__class__):
+        if other.__class__ is not self.__class__ and not isinstance(other, self.__class__):
             return True
 
-        return _C.g1_cmp(self.pt, other.pt) != _C.CONST_RLC_EQ
+        return _C.g1_cmp(self.pt, other.pt) != _RLC_EQ
 
     #
     # Aliases
@@ -411,6 +642,7 @@ class _G1ElementBase(object):
 class G1Element(_G1ElementBase):
     """Element of the G1 group."""
 
+    __slots__ = ()
     group = G1
 
     def double(self):
@@ -436,16 +668,34 @@ class G1Element(_G1ElementBase):
             >>> elem == 2 * generator
             True
         """
-        self._is_gen = False
+        self._invalidate()
         _C.g1_dbl(self.pt, self.pt)
         return self
 
+    def double_into(self, out):
+        """Store the double of the current element in out.
+
+        This avoids allocating a new element, which helps in tight loops.
+
+        Example:
+            >>> generator = G1.generator()
+            >>> elem = G1.neutral_element()
+            >>> _ = generator.double_into(elem)
+            >>> elem == 2 * generator
+            True
+        """
+        if not type(out) == type(self):
+            raise TypeError("Output parameter should be of type {} is {}".format(type(self), type(out)))
+
+        out._invalidate()
+        _C.g1_dbl(out.pt, self.pt)
+        return out
+
 
     #
     # Binary operators
     #
 
-    @check_same_type
     def __add__(self, other):
         """Add two points together.
 
@@ -459,11 +709,13 @@ class G1Element(_G1ElementBase):
             >>> a.add(b) == 50 * G1.generator()
             True
         """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
         res = self.__class__()
         _C.g1_add(res.pt, self.pt, other.pt)
         return res
 
-    @check_same_type
     def __iadd__(self, other):
         """Inplace add another point.
 
@@ -477,11 +729,13 @@ class G1Element(_G1ElementBase):
             >>> a == 13 * G1.generator()
             True
         """
-        self._is_gen = False
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        self._invalidate()
         _C.g1_add(self.pt, self.pt, other.pt)
         return self
 
-    @check_same_type
     def __sub__(self, other):
         """Substract two points
 
@@ -495,11 +749,13 @@ class G1Element(_G1ElementBase):
             >>> a.sub(b) == 37 * G1.generator()
             True
         """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
         res = self.__class__()
         _C.g1_sub(res.pt, self.pt, other.pt)
         return res
 
-    @check_same_type
     def __isub__(self, other):
         """Inplace substract another point.
 
@@ -513,12 +769,14 @@ class G1Element(_G1ElementBase):
             >>> a == 7 * G1.generator()
             True
         """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
 
-        self._is_gen = False
+
+        self._invalidate()
         _C.g1_sub(self.pt, self.pt, other.pt)
         return self
 
-    @force_Bn_other
     def __mul__(self, other):
         """Multiply point by a scalar
 
@@ -529,23 +787,37 @@ class G1Element(_G1ElementBase):
             >>> g + g == 2 * g
             True
         """
+        if other.__class__ is not Bn:
+            other = _coerce_Bn(other)
+            if other is NotImplemented:
+                return NotImplemented
+
         res = self.__class__()
         if self._is_gen:
             _C.g1_mul_gen(res.pt, other.bn)
+        elif self._table is not None:
+            scalar = self.group._reduce_scalar(other)
+            _C.g1_mul_fix(res.pt, self._table, scalar.bn)
         else:
-            _C.g1_mul(res.pt, self.pt, other.bn)
+            _C.petrelic_g1_mul(res.pt, self.pt, other.bn)
         return res
 
-    @force_Bn_other
     def __rmul__(self, other):
+        if other.__class__ is not Bn:
+            other = _coerce_Bn(other)
+            if other is NotImplemented:
+                return NotImplemented
+
         res = self.__class__()
         if self._is_gen:
             _C.g1_mul_gen(res.pt, other.bn)
+        elif self._table is not None:
+            scalar = self.group._reduce_scalar(other)
+            _C.g1_mul_fix(res.pt, self._table, scalar.bn)
         else:
-            _C.g1_mul(res.pt, self.pt, other.bn)
+            _C.petrelic_g1_mul(res.pt, self.pt, other.bn)
         return res
 
-    @force_Bn_other
     def __imul__(self, other):
         """Inplace point multiplication by a scalar
 
@@ -559,13 +831,43 @@ class G1Element(_G1ElementBase):
             >>> a == 10 * G1.generator()
             True
         """
+        if other.__class__ is not Bn:
+            other = _coerce_Bn(other)
+            if other is NotImplemented:
+                return NotImplemented
+
         if self._is_gen:
             _C.g1_mul_gen(self.pt, other.bn)
-            self._is_gen = False
+        elif self._table is not None:
+            scalar = self.group._reduce_scalar(other)
+            _C.g1_mul_fix(self.pt, self._table, scalar.bn)
         else:
-            _C.g1_mul(self.pt, self.pt, other.bn)
+            _C.petrelic_g1_mul(self.pt, self.pt, other.bn)
+        self._invalidate()
         return self
 
+    def mul_secret(self, other):
+        """Multiply point by a secret scalar
+
+        Uses a Montgomery ladder, whose sequence of operations does not depend
+        on the bits of the scalar. Prefer it to `n * pt` for secret keys.
+
+        Examples:
+            >>> g = G1.generator()
+            >>> g.mul_secret(10) == 10 * g
+            True
+        """
+        scalar = other
+        if scalar.__class__ is not Bn:
+            scalar = _coerce_Bn(scalar)
+            if scalar is NotImplemented:
+                raise TypeError("Scalar should be of type int or Bn is {}".format(type(other)))
+
+        res = self.__class__()
+        scalar = self.group._reduce_scalar(scalar)
+        _C.petrelic_g1_mul_monty(res.pt, self.pt, scalar.bn)
+        return res
+
     #
     # Aliases
     #
@@ -585,6 +887,11 @@ class G1Element(_G1ElementBase):
 class _G2Base(object):
     """Internal base class for G2"""
 
+    __slots__ = ()
+
+    _cached_order = None
+    _cached_barrett = None
+
     @classmethod
     def _element_type(cls):
         return G2Element
@@ -605,9 +912,28 @@ class _G2Base(object):
             >>> order * generator == neutral
             True
         """
-        order = Bn()
-        _C.g2_get_ord(order.bn)
-        return order
+        return cls._order().copy()
+
+    @classmethod
+    def _order(cls):
+        """Return the cached order of the group. Callers must not modify it."""
+        if _G2Base._cached_order is None:
+            order = Bn()
+            _C.g2_get_ord(order.bn)
+            _G2Base._cached_order = order
+        return _G2Base._cached_order
+
+    @classmethod
+    def _reduce_scalar(cls, k):
+        """Reduce the scalar k modulo the group order, using Barrett reduction."""
+        order = cls._order()
+        if _G2Base._cached_barrett is None:
+            barrett = Bn()
+            _C.bn_mod_pre_barrt(barrett.bn, order.bn)
+            _G2Base._cached_barrett = barrett
+        res = Bn()
+        _C.petrelic_bn_mod_barrt(res.bn, k.bn, order.bn, _G2Base._cached_barrett.bn)
+        return res
 
     @classmethod
     def generator(cls):
@@ -621,6 +947,7 @@ class _G2Base(object):
         """
         generator = cls._new_element()
         _C.g2_get_gen(generator.pt)
+        generator._is_gen = True
         return generator
 
     @classmethod
@@ -652,32 +979,97 @@ class _G2Base(object):
         _C.g2_map(res.pt, hinput, len(hinput))
         return res
 
+    @classmethod
+    def hash_to_point_batch(cls, hinputs):
+        """Return the group elements obtained by hashing each of the inputs
+
+        All inputs are hashed in a single call to RELIC.
+
+        Example:
+            >>> hinputs = [b"foo", b"bar"]
+            >>> elems = G2.hash_to_point_batch(hinputs)
+            >>> elems == [G2.hash_to_point(h) for h in hinputs]
+            True
+        """
+        buffers = [_FFI.from_buffer(h) for h in hinputs]
+        res = [cls._new_element() for _ in buffers]
+        points = _FFI.new("g2_st *[]", [el.pt for el in res])
+        bins = _FFI.new("char *[]", buffers)
+        lens = _FFI.new("int[]", [len(b) for b in buffers])
+        _C.petrelic_g2_map_lot(points, bins, lens, len(res))
+        return res
+
+    @classmethod
+    def _mul_batch(cls, scalars, elems):
+        """Multiply each element by its scalar in a single call to RELIC."""
+        terms = list(zip(coerce_scalars(scalars), elems))
+        res = [cls._new_element() for _ in terms]
+        _C.petrelic_g2_mul_lot(
+            _FFI.new("g2_st *[]", [el.pt for el in res]),
+            _FFI.new("g2_st *[]", [el.pt for _, el in terms]),
+            _FFI.new("bn_st *[]", [k.bn for k, _ in terms]),
+            len(terms))
+        return res
+
+    @classmethod
+    def _sum(cls, elems):
+        """Add the elements together in a single call to RELIC."""
+        elems = list(elems)
+        res = cls._new_element()
+        _C.petrelic_g2_add_lot(
+            res.pt,
+            _FFI.new("g2_t[]", (len(elems) + 1) // 2),
+            _FFI.new("g2_st *[]", [el.pt for el in elems]),
+            len(elems))
+        return res
+
+    @classmethod
+    def _wsum(cls, weights, elems):
+        """Compute the weighted sum using a simultaneous multiplication."""
+        terms = list(zip(coerce_scalars(weights), elems))
+        if len(terms) == 2 and (terms[0][1]._is_gen or terms[1][1]._is_gen):
+            # k * generator + m * q uses RELIC's precomputed generator table
+            (k, _), (m, q) = terms if terms[0][1]._is_gen else terms[::-1]
+            # Keep the reduced scalars alive until RELIC is done with them
+            k = cls._reduce_scalar(k)
+            m = cls._reduce_scalar(m)
+            res = cls._new_element()
+            _C.g2_mul_sim_gen(res.pt, k.bn, q.pt, m.bn)
+            return res
+
+        res = cls._new_element()
+        _C.petrelic_g2_wsum(
+            res.pt,
+            _FFI.new("g2_st *[]", [el.pt for _, el in terms]),
+            _FFI.new("bn_st *[]", [w.bn for w, _ in terms]),
+            len(terms))
+        return res
+
 
 class G2(_G2Base):
     """G2 group."""
 
+    __slots__ = ()
+
     @classmethod
     def sum(cls, elems):
         """Efficient sum of a number of elements
 
-        In the current implementation this function is not optimized.
+        The sum is computed in a single call to RELIC.
 
         Example:
             >>> elems = [ x * G2.generator() for x in [10, 25, 13]]
             >>> G2.sum(elems) ==  (10 + 25 + 13) * G2.generator()
             True
         """
-        res = cls.neutral_element()
-        for el in elems:
-            res += el
-
-        return res
+        return cls._sum(elems)
 
     @classmethod
     def wsum(cls, weights, elems):
-        """Efficient weighted product of a number of elements
+        """Efficient weighted sum of a number of elements
 
-        In the current implementation this function is not optimized.
+        The scalar multiplications are interleaved so that all elements share
+        the same doublings.
 
         Example:
             >>> weights = [1, 2, 3]
@@ -685,11 +1077,26 @@ class G2(_G2Base):
             >>> G2.wsum(weights, elems) ==  (1 * 10 + 2 * 25 + 3 * 13) * G2.generator()
             True
         """
-        res = cls.neutral_element()
-        for w, el in zip(weights, elems):
-            res += w * el
+        # Like w * el, accept the weights and the elements in either order
+        weights, elems = list(weights), list(elems)
+        if weights and isinstance(weights[0], _G2ElementBase):
+            weights, elems = elems, weights
 
-        return res
+        return cls._wsum(weights, elems)
+
+    @classmethod
+    def mul_batch(cls, scalars, elems):
+        """Multiply each element by the corresponding scalar
+
+        All multiplications are done in a single call to RELIC.
+
+        Example:
+            >>> scalars = [10, 25, 13]
+            >>> elems = [G2.generator()] * 3
+            >>> G2.mul_batch(scalars, elems) == [k * G2.generator() for k in scalars]
+            True
+        """
+        return cls._mul_batch(scalars, elems)
 
     #
     # Aliases
@@ -705,18 +1112,33 @@ class G2(_G2Base):
 
 
 class _G2ElementBase(object):
+    """Internal base class for G2 elements"""
+
+    __slots__ = ("pt", "_is_gen", "_table", "_bin")
+
     def __init__(self):
         """Initialize a new element of G2."""
         self.pt = _FFI.new("g2_t")
-        _C.g2_null(self.pt)
-        _C.g2_new(self.pt)
+        _C.petrelic_g2_init(self.pt)
+        self._is_gen = False
+        self._table = None
+        self._bin = None
 
     def __copy__(self):
         """Clone an element of G2."""
         copy = self.__class__()
         _C.g2_copy(copy.pt, self.pt)
+        copy._is_gen = self._is_gen
+        copy._table = self._table
+        copy._bin = self._bin
         return copy
 
+    def _invalidate(self):
+        """Drop the generator flag, table and encoding after a modification."""
+        self._is_gen = False
+        self._table = None
+        self._bin = None
+
     #
     # Misc
     #
@@ -725,18 +1147,27 @@ class _G2ElementBase(object):
         return bool(_C.g2_is_valid(self.pt))
 
     def is_neutral_element(self):
-        _C.g2_norm(self.pt, self.pt)
         return bool(_C.g2_is_infty(self.pt))
 
+    def _cached_binary(self):
+        """The compressed encoding, kept until the element is modified."""
+        if self._bin is None:
+            self._bin = self.to_binary()
+        return self._bin
+
     def __hash__(self):
         """Hash function used internally by Python."""
-        return self.to_binary().__hash__()
+        return self._cached_binary().__hash__()
 
     def __repr__(self):
         """String representation of the element of G2."""
-        pt_hex = self.to_binary().hex()
+        pt_hex = self._cached_binary().hex()
         return 'G2Element({})'.format(pt_hex)
 
+    def precompute(self):
+        self._table = _FFI.new("g2_t[]", _C.CONST_RLC_G2_TABLE)
+        _C.g2_mul_pre(self._table, self.pt)
+        return self
 
     #
     # Serialization
@@ -759,10 +1190,10 @@ class _G2ElementBase(object):
 
     def to_binary(self, compressed=True):
         flag = int(compressed)
-        length = _C.g2_size_bin(self.pt, flag)
-        buf = _FFI.new("char[]", length)
-        _C.g2_write_bin(buf, length, self.pt, flag)
-        return _FFI.unpack(buf, length)
+        length = _C.petrelic_g2_size_bin(self.pt, flag)
+        buf = bytearray(length)
+        _C.g2_write_bin(_FFI.from_buffer(buf), length, self.pt, flag)
+        return bytes(buf)
 
     #
     # Unary operators
@@ -774,6 +1205,7 @@ class _G2ElementBase(object):
         return res
 
     def iinverse(self):
+        self._invalidate()
         _C.g2_neg(self.pt, self.pt)
         return self
 
@@ -783,17 +1215,17 @@ class _G2ElementBase(object):
 
     def __eq__(self, other):
         """Check that the points on the EC are equal."""
-        if not isinstance(other, self.__class__):
+        if other.__class__ is not self.__class__ and not isinstance(other, self.__class__):
             return False
 
-        return _C.g2_cmp(self.pt, other.pt) == _C.CONST_RLC_EQ
+        return _C.g2_cmp(self.pt, other.pt) == _RLC_EQ
 
     def __ne__(self, other):
         """Check that the points on the EC are not equal."""
-        if not isinstance(other, self.__class__):
+        if other.__class__ is not self.__class__ and not isinstance(other, self.__class__):
             return True
 
-        return _C.g2_cmp(self.pt, other.pt) != _C.CONST_RLC_EQ
+        return _C.g2_cmp(self.pt, other.pt) != _RLC_EQ
 
     #
     # Aliases
@@ -803,19 +1235,24 @@ class _G2ElementBase(object):
     eq = __eq__
     ne = __ne__
 
-    # Copy documentation from G1Element
-    to_binary.__doc__ = G1Element.to_binary.__doc__.replace("G1", "G2")
+    # Copy documentation from G1Element, unless docstrings are stripped (python -OO)
+    if __doc__ is not None:
+        to_binary.__doc__ = G1Element.to_binary.__doc__.replace("G1", "G2")
 
-    is_valid.__doc__ = G1Element.is_valid.__doc__.replace("G1", "G2")
-    is_neutral_element.__doc__ = G1Element.is_neutral_element.__doc__.replace("G1", "G2")
-    inverse.__doc__ = G1Element.inverse.__doc__.replace("G1", "G2")
-    iinverse.__doc__ = G1Element.iinverse.__doc__.replace("G1", "G2")
+        is_valid.__doc__ = G1Element.is_valid.__doc__.replace("G1", "G2")
+        is_neutral_element.__doc__ = G1Element.is_neutral_element.__doc__.replace("G1", "G2")
+        precompute.__doc__ = G1Element.precompute.__doc__.replace("G1", "G2")
+        inverse.__doc__ = G1Element.inverse.__doc__.replace("G1", "G2")
+        iinverse.__doc__ = G1Element.iinverse.__doc__.replace("G1", "G2")
 
 
 
 class G2Element(_G2ElementBase):
     """Element of the G2 group."""
 
+    __slots__ = ()
+    group = G2
+
     #
     # Unary operators
     #
@@ -826,64 +1263,129 @@ class G2Element(_G2ElementBase):
         return res
 
     def idouble(self):
+        self._invalidate()
         _C.g2_dbl(self.pt, self.pt)
         return self
 
+    def double_into(self, out):
+        if not type(out) == type(self):
+            raise TypeError("Output parameter should be of type {} is {}".format(type(self), type(out)))
+
+        out._invalidate()
+        _C.g2_dbl(out.pt, self.pt)
+        return out
+
     #
     # Binary operators
     #
 
-    @check_same_type
     def __add__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
         res = self.__class__()
         _C.g2_add(res.pt, self.pt, other.pt)
         return res
 
-    @check_same_type
     def __iadd__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        self._invalidate()
         _C.g2_add(self.pt, self.pt, other.pt)
         return self
 
-    @check_same_type
     def __sub__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
         res = self.__class__()
         _C.g2_sub(res.pt, self.pt, other.pt)
         return res
 
-    @check_same_type
     def __isub__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        self._invalidate()
         _C.g2_sub(self.pt, self.pt, other.pt)
         return self
 
-    @force_Bn_other
     def __mul__(self, other):
+        if other.__class__ is not Bn:
+            other = _coerce_Bn(other)
+            if other is NotImplemented:
+                return NotImplemented
+
         res = self.__class__()
-        _C.g2_mul(res.pt, self.pt, other.bn)
+        if self._is_gen:
+            _C.g2_mul_gen(res.pt, other.bn)
+        elif self._table is not None:
+            scalar = self.group._reduce_scalar(other)
+            _C.g2_mul_fix(res.pt, self._table, scalar.bn)
+        else:
+            _C.petrelic_g2_mul(res.pt, self.pt, other.bn)
         return res
 
-    @force_Bn_other
     def __rmul__(self, other):
+        if other.__class__ is not Bn:
+            other = _coerce_Bn(other)
+            if other is NotImplemented:
+                return NotImplemented
+
         res = self.__class__()
-        _C.g2_mul(res.pt, self.pt, other.bn)
+        if self._is_gen:
+            _C.g2_mul_gen(res.pt, other.bn)
+        elif self._table is not None:
+            scalar = self.group._reduce_scalar(other)
+            _C.g2_mul_fix(res.pt, self._table, scalar.bn)
+        else:
+            _C.petrelic_g2_mul(res.pt, self.pt, other.bn)
         return res
 
-    @force_Bn_other
     def __imul__(self, other):
-        _C.g2_mul(self.pt, self.pt, other.bn)
+        if other.__class__ is not Bn:
+            other = _coerce_Bn(other)
+            if other is NotImplemented:
+                return NotImplemented
+
+        if self._is_gen:
+            _C.g2_mul_gen(self.pt, other.bn)
+        elif self._table is not None:
+            scalar = self.group._reduce_scalar(other)
+            _C.g2_mul_fix(self.pt, self._table, scalar.bn)
+        else:
+            _C.petrelic_g2_mul(self.pt, self.pt, other.bn)
+        self._invalidate()
         return self
 
-    # Copy documentation from G1Element
-    double.__doc__ = G1Element.double.__doc__.replace("G1", "G2")
-    idouble.__doc__ = G1Element.idouble.__doc__.replace("G1", "G2")
+    def mul_secret(self, other):
+        scalar = other
+        if scalar.__class__ is not Bn:
+            scalar = _coerce_Bn(scalar)
+            if scalar is NotImplemented:
+                raise TypeError("Scalar should be of type int or Bn is {}".format(type(other)))
+
+        res = self.__class__()
+        scalar = self.group._reduce_scalar(scalar)
+        _C.petrelic_g2_mul_monty(res.pt, self.pt, scalar.bn)
+        return res
 
-    __add__.__doc__ = G1Element.__add__.__doc__.replace("G1", "G2")
-    __iadd__.__doc__ = G1Element.__add__.__doc__.replace("G1", "G2")
+    # Copy documentation from G1Element, unless docstrings are stripped (python -OO)
+    if __doc__ is not None:
+        double.__doc__ = G1Element.double.__doc__.replace("G1", "G2")
+        idouble.__doc__ = G1Element.idouble.__doc__.replace("G1", "G2")
+        double_into.__doc__ = G1Element.double_into.__doc__.replace("G1", "G2")
 
-    __sub__.__doc__ = G1Element.__sub__.__doc__.replace("G1", "G2")
-    __isub__.__doc__ = G1Element.__isub__.__doc__.replace("G1", "G2")
+        __add__.__doc__ = G1Element.__add__.__doc__.replace("G1", "G2")
+        __iadd__.__doc__ = G1Element.__add__.__doc__.replace("G1", "G2")
 
-    __mul__.__doc__ = G1Element.__mul__.__doc__.replace("G1", "G2")
-    __imul__.__doc__ = G1Element.__imul__.__doc__.replace("G1", "G2")
+        __sub__.__doc__ = G1Element.__sub__.__doc__.replace("G1", "G2")
+        __isub__.__doc__ = G1Element.__isub__.__doc__.replace("G1", "G2")
+
+        __mul__.__doc__ = G1Element.__mul__.__doc__.replace("G1", "G2")
+        __imul__.__doc__ = G1Element.__imul__.__doc__.replace("G1", "G2")
+        mul_secret.__doc__ = G1Element.mul_secret.__doc__.replace("G1", "G2")
 
     #
     # Aliases
@@ -904,6 +1406,13 @@ class G2Element(_G2ElementBase):
 class _GTBase(object):
     """Internal base class for GT"""
 
+    __slots__ = ()
+
+    _gen = None
+    _gen_table = None
+    _cached_order = None
+    _cached_barrett = None
+
     @classmethod
     def _element_type(cls):
         return GTElement
@@ -924,9 +1433,28 @@ class _GTBase(object):
             >>> generator ** order == neutral
             True
         """
-        order = Bn()
-        _C.gt_get_ord(order.bn)
-        return order
+        return cls._order().copy()
+
+    @classmethod
+    def _order(cls):
+        """Return the cached order of the group. Callers must not modify it."""
+        if _GTBase._cached_order is None:
+            order = Bn()
+            _C.gt_get_ord(order.bn)
+            _GTBase._cached_order = order
+        return _GTBase._cached_order
+
+    @classmethod
+    def _reduce_exponent(cls, k):
+        """Reduce the exponent k modulo the group order, using Barrett reduction."""
+        order = cls._order()
+        if _GTBase._cached_barrett is None:
+            barrett = Bn()
+            _C.bn_mod_pre_barrt(barrett.bn, order.bn)
+            _GTBase._cached_barrett = barrett
+        res = Bn()
+        _C.petrelic_bn_mod_barrt(res.bn, k.bn, order.bn, _GTBase._cached_barrett.bn)
+        return res
 
     @classmethod
     def generator(cls):
@@ -938,10 +1466,30 @@ class _GTBase(object):
             >>> generator * neutral == generator
             True
         """
+        if _GTBase._gen is None:
+            # Depending on the RELIC version, gt_get_gen computes a pairing
+            gen = _FFI.new("gt_t")
+            _C.gt_get_gen(gen)
+            _GTBase._gen = gen
+
         generator = cls._new_element()
-        _C.gt_get_gen(generator.pt)
+        _C.gt_copy(generator.pt, _GTBase._gen)
+        generator._is_gen = True
         return generator
 
+    @classmethod
+    def _generator_table(cls):
+        """Return the fixed-base exponentiation table of the generator.
+
+        The table is computed once and shared by all GT interfaces.
+        """
+        if _GTBase._gen_table is None:
+            generator = cls.generator()
+            table = _FFI.new("gt_t[]", _GT_TABLE_SIZE)
+            _C.petrelic_gt_exp_pre(table, generator.pt)
+            _GTBase._gen_table = table
+        return _GTBase._gen_table
+
     @classmethod
     def neutral_element(cls):
         """Return the neutral element of the group GT.
@@ -957,30 +1505,90 @@ class _GTBase(object):
         _C.gt_set_unity(neutral.pt)
         return neutral
 
+    @classmethod
+    def _prod(cls, elems):
+        """Multiply the elements together in a single call to RELIC."""
+        elems = list(elems)
+        res = cls._new_element()
+        _C.petrelic_gt_mul_lot(
+            res.pt,
+            _FFI.new("gt_t[]", (len(elems) + 1) // 2),
+            _FFI.new("fp6_t *[]", [el.pt for el in elems]),
+            len(elems))
+        return res
+
+    @classmethod
+    def _wprod(cls, weights, elems):
+        """Compute the weighted product using a simultaneous multi-exponentiation."""
+        terms = list(zip(coerce_scalars(weights), elems))
+        res = cls._new_element()
+        _C.petrelic_gt_wprod(
+            res.pt,
+            _FFI.new("fp6_t *[]", [el.pt for _, el in terms]),
+            _FFI.new("bn_st *[]", [w.bn for w, _ in terms]),
+            len(terms))
+        return res
+
+    @classmethod
+    def _multi_pair(cls, g1_elems, g2_elems, scalars=None):
+        """Compute the product of the pairings with a single final exponentiation.
+
+        The optional scalars multiply the elements of G1, where scalar
+        multiplication is cheapest.
+        """
+        terms = list(zip(g1_elems, g2_elems))
+        g1_points = _FFI.new("g1_t[]", len(terms))
+        g2_points = _FFI.new("g2_t[]", len(terms))
+        if scalars is not None:
+            scalars = [_G1Base._reduce_scalar(k) for k in coerce_scalars(scalars)]
+        for i, (p, q) in enumerate(terms):
+            if scalars is None:
+                _C.g1_copy(g1_points[i], p.pt)
+            else:
+                _C.petrelic_g1_mul(g1_points[i], p.pt, scalars[i].bn)
+            _C.g2_copy(g2_points[i], q.pt)
+
+        res = cls._new_element()
+        _C.petrelic_pc_map_sim(res.pt, g1_points, g2_points, len(terms))
+        return res
+
+    @classmethod
+    def _exp_batch(cls, exponents, elems):
+        """Raise each element to its exponent in a single call to RELIC."""
+        terms = [(cls._reduce_exponent(k), el) for k, el in zip(coerce_scalars(exponents), elems)]
+        res = [cls._new_element() for _ in terms]
+        _C.petrelic_gt_exp_lot(
+            _FFI.new("fp6_t *[]", [el.pt for el in res]),
+            _FFI.new("fp6_t *[]", [el.pt for _, el in terms]),
+            _FFI.new("bn_st *[]", [k.bn for k, _ in terms]),
+            len(terms))
+        return res
+
+
 class GT(_GTBase):
     """GT group."""
 
+    __slots__ = ()
+
     @classmethod
     def prod(cls, elems):
         """Efficient product of a number of elements
 
-        In the current implementation this function is not optimized.
+        The product is computed in a single call to RELIC.
 
         Example:
             >>> elems = [ GT.generator() ** x for x in [10, 25, 13]]
             >>> GT.prod(elems) ==  GT.generator() ** (10 + 25 + 13)
             True
         """
-        res = cls.neutral_element()
-        for el in elems:
-            res *= el
-        return res
+        return cls._prod(elems)
 
     @classmethod
     def wprod(cls, weights, elems):
         """Efficient weighted product of a number of elements
 
-        In the current implementation this function is not optimized.
+        The exponentiations are interleaved so that all elements share the
+        same squarings.
 
         Example:
             >>> weights = [1, 2, 3]
@@ -988,11 +1596,21 @@ class GT(_GTBase):
             >>> GT.wprod(weights, elems) ==  GT.generator() ** (1 * 10 + 2 * 25 + 3 * 13)
             True
         """
-        res = cls.neutral_element()
-        for w, el in zip(weights, elems):
-            res *= el ** w
+        return cls._wprod(weights, elems)
 
-        return res
+    @classmethod
+    def pow_batch(cls, exponents, elems):
+        """Raise each element to the corresponding exponent
+
+        All exponentiations are done in a single call to RELIC.
+
+        Example:
+            >>> exponents = [10, 25, 13]
+            >>> elems = [GT.generator()] * 3
+            >>> GT.pow_batch(exponents, elems) == [GT.generator() ** k for k in exponents]
+            True
+        """
+        return cls._exp_batch(exponents, elems)
 
     #
     # Aliases
@@ -1008,19 +1626,33 @@ class GT(_GTBase):
 
 
 class _GTElementBase(object):
+    """Internal base class for GT elements"""
+
+    __slots__ = ("pt", "_is_gen", "_table", "_bin")
 
     def __init__(self):
         """Initialize a new element of GT."""
         self.pt = _FFI.new("gt_t")
-        _C.gt_null(self.pt)
-        _C.gt_new(self.pt)
+        _C.petrelic_gt_init(self.pt)
+        self._is_gen = False
+        self._table = None
+        self._bin = None
 
     def __copy__(self):
         """Clone an element of GT."""
         copy = self.__class__()
         _C.gt_copy(copy.pt, self.pt)
+        copy._is_gen = self._is_gen
+        copy._table = self._table
+        copy._bin = self._bin
         return copy
 
+    def _invalidate(self):
+        """Drop the generator flag, table and encoding after a modification."""
+        self._is_gen = False
+        self._table = None
+        self._bin = None
+
     #
     # Misc
     #
@@ -1051,13 +1683,37 @@ class _GTElementBase(object):
         """
         return bool(_C.gt_is_unity(self.pt))
 
+    def precompute(self):
+        """Precompute a table to speed up exponentiations of this element.
+
+        This pays off when the same element is raised to many exponents. The
+        table is discarded when the element is modified in place. It holds 960
+        elements of GT (64 windows of 4 bits), about 550 kB, so only
+        precompute elements that are reused many times.
+
+        Example:
+            >>> elem = GT.generator() ** 1337
+            >>> _ = elem.precompute()
+            >>> elem ** 42 == GT.generator() ** (1337 * 42)
+            True
+        """
+        self._table = _FFI.new("gt_t[]", _GT_TABLE_SIZE)
+        _C.petrelic_gt_exp_pre(self._table, self.pt)
+        return self
+
+    def _cached_binary(self):
+        """The compressed encoding, kept until the element is modified."""
+        if self._bin is None:
+            self._bin = self.to_binary()
+        return self._bin
+
     def __hash__(self):
         """Hash function used internally by Python."""
-        return self.to_binary().__hash__()
+        return self._cached_binary().__hash__()
 
     def __repr__(self):
         """String representation of the element of G2."""
-        pt_hex = self.to_binary().hex()
+        pt_hex = self._cached_binary().hex()
         return 'GTElement({})'.format(pt_hex)
 
     #
@@ -1081,12 +1737,13 @@ class _GTElementBase(object):
 
     def to_binary(self, compressed=True):
         flag = int(compressed)
-        length = _C.gt_size_bin(self.pt, flag)
-        buf = _FFI.new("char[]", length)
-        _C.gt_write_bin(buf, length, self.pt, flag)
-        return _FFI.unpack(buf, length)
+        length = _C.petrelic_gt_size_bin(self.pt, flag)
+        buf = bytearray(length)
+        _C.gt_write_bin(_FFI.from_buffer(buf), length, self.pt, flag)
+        return bytes(buf)
 
-    to_binary.__doc__ = G1Element.to_binary.__doc__.replace("G1", "GT")
+    if __doc__ is not None:
+        to_binary.__doc__ = G1Element.to_binary.__doc__.replace("G1", "GT")
 
 
     #
@@ -1117,6 +1774,7 @@ class _GTElementBase(object):
             >>> elem1 == elem2.inverse()
             True
         """
+        self._invalidate()
         _C.gt_inv(self.pt, self.pt)
         return self
 
@@ -1126,17 +1784,17 @@ class _GTElementBase(object):
 
     def __eq__(self, other):
         """Check that the points are equal."""
-        if not isinstance(other, self.__class__):
+        if other.__class__ is not self.__class__ and not isinstance(other, self.__class__):
             return False
 
-        return _C.gt_cmp(self.pt, other.pt) == _C.CONST_RLC_EQ
+        return _C.gt_cmp(self.pt, other.pt) == _RLC_EQ
 
     def __ne__(self, other):
         """Check that the points on the EC are not equal."""
-        if not isinstance(other, self.__class__):
+        if other.__class__ is not self.__class__ and not isinstance(other, self.__class__):
             return True
 
-        return _C.gt_cmp(self.pt, other.pt) != _C.CONST_RLC_EQ
+        return _C.gt_cmp(self.pt, other.pt) != _RLC_EQ
 
     #
     # Aliases
@@ -1150,6 +1808,7 @@ class _GTElementBase(object):
 class GTElement(_GTElementBase):
     """GT element."""
 
+    __slots__ = ()
     group = GT
 
 
@@ -1163,7 +1822,7 @@ class GTElement(_GTElementBase):
             True
         """
         res = self.__class__()
-        _C.gt_sqr(res.pt, self.pt)
+        _C.fp12_sqr_cyc(res.pt, self.pt)
         return res
 
     def isquare(self):
@@ -1175,15 +1834,34 @@ class GTElement(_GTElementBase):
             >>> elem == GT.generator() ** 2
             True
         """
-        _C.gt_sqr(self.pt, self.pt)
+        self._invalidate()
+        _C.fp12_sqr_cyc(self.pt, self.pt)
         return self
 
+    def square_into(self, out):
+        """Store the square of the current element in out.
+
+        This avoids allocating a new element, which helps in tight loops.
+
+        Example:
+            >>> generator = GT.generator()
+            >>> elem = GT.neutral_element()
+            >>> _ = generator.square_into(elem)
+            >>> elem == generator ** 2
+            True
+        """
+        if not type(out) == type(self):
+            raise TypeError("Output parameter should be of type {} is {}".format(type(self), type(out)))
+
+        out._invalidate()
+        _C.fp12_sqr_cyc(out.pt, self.pt)
+        return out
+
 
     #
     # Binary operators
     #
 
-    @check_same_type
     def __mul__(self, other):
         """Multiply two elements
 
@@ -1197,11 +1875,13 @@ class GTElement(_GTElementBase):
             >>> a.mul(b) == GT.generator() ** 50
             True
         """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
         res = self.__class__()
         _C.gt_mul(res.pt, self.pt, other.pt)
         return res
 
-    @check_same_type
     def __imul__(self, other):
         """Inplace multiplication by another element
 
@@ -1215,10 +1895,13 @@ class GTElement(_GTElementBase):
             >>> a == GT.generator() ** 13
             True
         """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        self._invalidate()
         _C.gt_mul(self.pt, self.pt, other.pt)
         return self
 
-    @check_same_type
     def __truediv__(self, other):
         """Divide two points
 
@@ -1234,11 +1917,13 @@ class GTElement(_GTElementBase):
             >>> a.div(b) == GT.generator() ** 37
             True
         """
-        res = other.inverse()
-        _C.gt_mul(res.pt, self.pt, res.pt)
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        res = self.__class__()
+        _C.petrelic_gt_div(res.pt, self.pt, other.pt)
         return res
 
-    @check_same_type
     def __itruediv__(self, other):
         """Inplace division by another point
 
@@ -1252,11 +1937,17 @@ class GTElement(_GTElementBase):
             >>> a == GT.generator() ** 7
             True
         """
-        other_inv = other.inverse()
-        _C.gt_mul(self.pt, self.pt, other_inv.pt)
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        self._invalidate()
+        if other is self:
+            _C.gt_set_unity(self.pt)
+            return self
+
+        _C.petrelic_gt_div(self.pt, self.pt, other.pt)
         return self
 
-    @force_Bn_other
     def __pow__(self, other):
         """Raise element to the power of a scalar
 
@@ -1269,12 +1960,21 @@ class GTElement(_GTElementBase):
             >>> g * g == g.pow(2)
             True
         """
+        if other.__class__ is not Bn:
+            other = _coerce_Bn(other)
+            if other is NotImplemented:
+                return NotImplemented
+
         res = self.__class__()
-        exponent = other.mod(self.group.order())
-        _C.gt_exp(res.pt, self.pt, exponent.bn)
+        exponent = self.group._reduce_exponent(other)
+        if self._is_gen:
+            _C.petrelic_gt_exp_fix(res.pt, self.group._generator_table(), exponent.bn)
+        elif self._table is not None:
+            _C.petrelic_gt_exp_fix(res.pt, self._table, exponent.bn)
+        else:
+            _C.petrelic_gt_exp(res.pt, self.pt, exponent.bn)
         return res
 
-    @force_Bn_other
     def __ipow__(self, other):
         """Inplace raise element to the power of a scalar
 
@@ -1285,8 +1985,19 @@ class GTElement(_GTElementBase):
             >>> g * g * g == a
             True
         """
-        exponent = other.mod(self.group.order())
-        _C.gt_exp(self.pt, self.pt, exponent.bn)
+        if other.__class__ is not Bn:
+            other = _coerce_Bn(other)
+            if other is NotImplemented:
+                return NotImplemented
+
+        exponent = self.group._reduce_exponent(other)
+        if self._is_gen:
+            _C.petrelic_gt_exp_fix(self.pt, self.group._generator_table(), exponent.bn)
+        elif self._table is not None:
+            _C.petrelic_gt_exp_fix(self.pt, self._table, exponent.bn)
+        else:
+            _C.petrelic_gt_exp(self.pt, self.pt, exponent.bn)
+        self._invalidate()
         return self
 
 
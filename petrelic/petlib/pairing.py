@@ -20,6 +20,8 @@ class BilinearGroupPair:
     ``bplib.bp.BpGroup`` object is also embedded.
     """
 
+    __slots__ = ("G1", "G2", "GT")
+
     def __init__(self):
         self.GT = GTGroup()
         self.G1 = G1Group()
@@ -31,10 +33,32 @@ class BilinearGroupPair:
         """
         return self.G1, self.G2, self.GT
 
+    multi_pair = native.copy_method(native.BilinearGroupPair.multi_pair, "multi_pair")
+
+    if __doc__ is not None:
+        multi_pair.__doc__ = """Returns the product of the pairings of the elements of G1
+        with the corresponding elements of G2.
+
+        The Miller loops share a single final exponentiation, which is much
+        faster than multiplying the pairings one by one. If scalars are given,
+        the element of G1 in each pairing is first multiplied by the
+        corresponding scalar.
+
+        Example:
+            >>> bgp = BilinearGroupPair()
+            >>> g1, g2 = bgp.G1.generator(), bgp.G2.generator()
+            >>> bgp.multi_pair([10 * g1, g1], [g2, 5 * g2]) == g1.pair(g2) ** 15
+            True
+            >>> bgp.multi_pair([g1, g1], [g2, 5 * g2], [10, 2]) == g1.pair(g2) ** 20
+            True
+        """
+
 
 class G1Group(native.G1):
     """G1 group"""
 
+    __slots__ = ()
+
     @classmethod
     def _element_type(cls):
         return G1Elem
@@ -64,6 +88,7 @@ class G1Group(native.G1):
 class G1Elem(native.G1Element):
     """Element of the G1 group"""
 
+    __slots__ = ()
     group = G1Group
 
     pt_add = native.G1Element.__add__
@@ -95,7 +120,7 @@ class G1Elem(native.G1Element):
             >>> p.pair(q) == GT.generator() ** 20000
             True
         """
-        if not type(other) == G2Elem:
+        if other.__class__ is not G2Elem and not isinstance(other, G2Elem):
             raise TypeError("Second parameter should be of type G2Elem is {}".format(type(other)))
 
         res = GTElem()
@@ -132,6 +157,8 @@ class G1Elem(native.G1Element):
 class G2Group(native.G2):
     """G2 group"""
 
+    __slots__ = ()
+
     @classmethod
     def _element_type(cls):
         return G2Elem
@@ -162,6 +189,7 @@ class G2Group(native.G2):
 class G2Elem(native.G2Element):
     """Element of the G2 group"""
 
+    __slots__ = ()
     group = G1Group
 
     pt_add = native.G2Element.__add__
@@ -196,6 +224,8 @@ class G2Elem(native.G2Element):
 class GTGroup(native.GT):
     """GT group"""
 
+    __slots__ = ()
+
     @classmethod
     def _element_type(cls):
         return GTElem
@@ -219,6 +249,7 @@ class GTGroup(native.GT):
 class GTElem(native.GTElement):
     """GT element"""
 
+    __slots__ = ()
     group = GTGroup
 
     mul_inplace = native.GTElement.__imul__
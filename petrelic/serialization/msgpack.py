@@ -1,24 +1,15 @@
 # WARNING: work in progress. Do not use
 
-import msgpack
 #import petlib.pack as pack
 
 def pt_enc(obj):
     """Encoder for the wrapped points."""
-    data = obj.to_binary()
-    packed_data = msgpack.packb(data)
-    return packed_data
+    return obj.to_binary()
 
 
 def pt_dec(bptype):
     """Decoder for the wrapped points."""
-
-    def dec(data):
-        data_extracted = msgpack.unpackb(data)
-        pt = bptype.from_binary(data_extracted)
-        return pt
-
-    return dec
+    return bptype.from_binary
 
 
 # Register encoders and decoders for pairing points
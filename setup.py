@@ -9,7 +9,7 @@ from setuptools.dist import Distribution
 PACKAGE_NAME = "petrelic"
 SETUP_REQUIRE = ["pytest-runner", "cffi>=1.0.0"]
 TEST_REQUIRE = ["pytest"]
-INSTALL_REQUIRE = ["cffi>=1.0.0", "msgpack>=1.0.3"]
+INSTALL_REQUIRE = ["cffi>=1.0.0"]
 DEV_REQUIRE = TEST_REQUIRE + ["sphinx", "sphinx_rtd_theme", "black"]
 CFFI_MODULES = "petrelic/compile.py:_FFI"
 
@@ -50,6 +50,18 @@ def test_pair_type():
         a.pair(11)
 
 
+def test_multi_pair():
+    bgp = BilinearGroupPair()
+    g1, g2 = G1.generator(), G2.generator()
+
+    res = bgp.multi_pair([3 * g1, 5 * g1], [7 * g2, 11 * g2])
+    assert res == (3 * 7 + 5 * 11) * g1.pair(g2)
+    assert isinstance(res, GTElement)
+
+    res = bgp.multi_pair([g1, g1], [7 * g2, 11 * g2], [3, 5])
+    assert res == (3 * 7 + 5 * 11) * g1.pair(g2)
+
+
 def test_is_valid(group):
     assert group.generator().is_valid()
     assert (100 * group.generator()).is_valid()
@@ -127,7 +139,6 @@ def test_ec_binary_encoding(group):
     assert g.from_binary(i.to_binary()) == i
 
 
-@pytest.mark.skip(reason="not planning to implement this for now")
 def test_ec_sum(group):
     g = group.generator()
     assert group.sum([g] * 10) == (10 * g)
@@ -135,6 +146,9 @@ def test_ec_sum(group):
     order = group.order()
     h = order.random() * g
     assert group.wsum([Bn(10), Bn(20)], [g, h]) == 10 * g + 20 * h
+    assert group.wsum([-3, 5], [g, h]) == -3 * g + 5 * h
+    assert group.sum([]) == group.neutral_element()
+    assert group.wsum([], []) == group.neutral_element()
 
 
 def test_iadd(group):
@@ -259,3 +273,18 @@ def test_wsum_groups(group):
 
     # Make sure the type is still correct
     assert s.__class__ == g.__class__
+
+
+def test_mul_batch(group):
+    g = group.generator()
+    order = group.order()
+    scalars = [order.random() for _ in range(5)] + [0, -3, 7]
+    elems = [order.random() * g for _ in scalars]
+
+    res = group.mul_batch(scalars, elems)
+    assert res == [k * el for k, el in zip(scalars, elems)]
+    assert all(el.__class__ == g.__class__ for el in res)
+    assert group.mul_batch([], []) == []
+
+    with pytest.raises(TypeError):
+        group.mul_batch(["foo"], [g])
@@ -22,6 +22,14 @@ def test_bn_constructors():
     with pytest.raises(Exception):
         Bn.from_hex("100ABCZ")
 
+    with pytest.raises(Exception):
+        Bn.from_hex("10 0A")
+
+    with pytest.raises(Exception):
+        Bn.from_decimal("\u0661\u0662")
+
+    assert Bn.from_hex("-fFf") == -0xfff
+
     assert Bn.from_hex(Bn(-100).hex()) == -100
     assert Bn(15).hex() == Bn(15).hex()
 
@@ -32,6 +40,8 @@ def test_bn_constructors():
     # assert Bn.from_binary(Bn(-100).binary()) == 100
     assert Bn.from_binary(Bn(100).binary()) == Bn(100)
     assert Bn.from_binary(Bn(100).binary()) == 100
+    assert Bn.from_binary(bytearray(Bn(100).binary())) == 100
+    assert Bn.from_binary(memoryview(b"\x00\x01\x02")[1:]) == 258
 
     # assert Bn.from_binary(Bn(-100).binary()) != Bn(50)
     assert int(Bn(-100)) == -100
@@ -50,6 +60,7 @@ def test_bn_large_integer():
 
     assert a.num_bits() == 129
     assert a == Bn(2) ** 128 + 1
+    assert int(a) == num
 
 
 def test_bn_large_negative_integer():
@@ -58,6 +69,7 @@ def test_bn_large_negative_integer():
 
     assert a.num_bits() == 128
     assert a == -Bn(2) ** 128 + 1
+    assert int(a) == num
 
 
 def test_bn_prime():
@@ -133,6 +145,13 @@ def test_bn_arithmetic():
     assert Bn(10).mod_add(10, 15) == (10 + 10) % 15
     assert Bn(10).mod_sub(100, 15) == (10 - 100) % 15
     assert Bn(10).mod_mul(10, 15) == (10 * 10) % 15
+
+    # Reduced operands take a shortcut, the others go through a division
+    m = 2 ** 255 - 19
+    for a, b in [(3, m - 1), (m - 1, m - 2), (5, 7), (m + 3, 4), (3 * m, m + 1)]:
+        assert Bn(a).mod_add(b, m) == (a + b) % m
+        assert Bn(a).mod_sub(b, m) == (a - b) % m
+        assert Bn(a).mod_mul(b, m) == (a * b) % m
     assert Bn(-1).bool()
 
 
@@ -231,3 +250,25 @@ def test_bn_abs():
 def test_bn_pow():
     assert Bn(2).pow(Bn(8)) == Bn(256)
     assert Bn(2).pow(8) == Bn(256)
+
+def test_bn_pow_large():
+    assert Bn(3) ** 200 == Bn(3 ** 200)
+    assert Bn(-3) ** 5 == Bn(-243)
+
+    # Odd and even moduli take different paths
+    for m in [2 ** 255 - 19, 2 ** 128]:
+        assert pow(Bn(7), Bn(3 ** 100), Bn(m)) == Bn(pow(7, 3 ** 100, m))
+        assert pow(Bn(-7), 5, Bn(m)) == Bn(pow(-7, 5, m))
+    assert pow(Bn(3), -5, 2 ** 255 - 19) == Bn(pow(3, -5, 2 ** 255 - 19))
+
+    # The exponent is left untouched
+    e = Bn(-5)
+    pow(Bn(3), e, 2 ** 255 - 19)
+    assert e == Bn(-5)
+
+
+def test_bn_hash():
+    a = Bn(2 ** 100 + 7)
+    assert hash(a) == hash(2 ** 100 + 7)
+    assert hash(a) == hash(a.copy())
+    assert {a: 1}[Bn(2 ** 100 + 7)] == 1
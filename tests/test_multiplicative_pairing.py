@@ -57,6 +57,44 @@ def test_pair_type():
         a.pair(11)
 
 
+def test_multi_pair():
+    bgp = BilinearGroupPair()
+    g1, g2 = G1.generator(), G2.generator()
+
+    res = bgp.multi_pair([g1 ** 3, g1 ** 5], [g2 ** 7, g2 ** 11])
+    assert res == g1.pair(g2) ** (3 * 7 + 5 * 11)
+    assert isinstance(res, GTElement)
+
+    res = bgp.multi_pair([g1, g1], [g2 ** 7, g2 ** 11], [3, 5])
+    assert res == g1.pair(g2) ** (3 * 7 + 5 * 11)
+
+
+def test_pair_into():
+    g1, g2 = G1.generator(), G2.generator()
+    out = GT.generator()
+    assert (g1 ** 3).pair_into(g2 ** 5, out) is out
+    assert out == g1.pair(g2) ** 15
+
+    with pytest.raises(TypeError):
+        g1.pair_into(g2, g1)
+
+
+def test_copied_methods_belong_to_module():
+    # doctest only collects docstrings of functions from the module itself
+    assert G1Element.__mul__.__module__ == "petrelic.multiplicative.pairing"
+    assert G1Element.__mul__.__qualname__ == "G1Element.__mul__"
+
+
+@pytest.mark.parametrize("group", [G1, G2])
+def test_pow_secret(group):
+    h = group.hash_to_point(b"secret exponents")
+    k = group.order().random()
+    assert h.pow_secret(k) == h ** k
+
+    with pytest.raises(TypeError):
+        h.pow_secret("foo")
+
+
 def test_order(group):
     g = group.generator()
     o = group.order()
@@ -166,3 +204,15 @@ def test_iinverse(group):
 
     h.iinverse()
     assert h == hinv
+
+
+def test_pow_batch(group):
+    g = group.generator()
+    order = group.order()
+    exponents = [order.random() for _ in range(5)] + [0, -3, 7]
+    elems = [g ** order.random() for _ in exponents]
+
+    res = group.pow_batch(exponents, elems)
+    assert res == [el ** k for k, el in zip(exponents, elems)]
+    assert all(el.__class__ == g.__class__ for el in res)
+    assert group.pow_batch([], []) == []
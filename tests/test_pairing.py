@@ -53,6 +53,45 @@ def test_pair_type():
         a.pair(11)
 
 
+def test_pair_into():
+    g1, g2 = G1.generator(), G2.generator()
+    out = GT.generator()
+    assert (3 * g1).pair_into(5 * g2, out) is out
+    assert out == g1.pair(g2) ** 15
+
+    with pytest.raises(TypeError):
+        g1.pair_into(g2, g1)
+
+    with pytest.raises(TypeError):
+        g1.pair_into(g1, out)
+
+
+def test_multi_pair():
+    bgp = BilinearGroupPair()
+    g1, g2 = G1.generator(), G2.generator()
+    ps = [3 * g1, 5 * g1, G1.neutral_element()]
+    qs = [7 * g2, 11 * g2, g2]
+
+    assert bgp.multi_pair(ps, qs) == g1.pair(g2) ** (3 * 7 + 5 * 11)
+    assert bgp.multi_pair([], []) == GT.neutral_element()
+
+    # Scalars are applied to the elements of G1
+    scalars = [2, Bn(-1), G1.order() + 3]
+    assert bgp.multi_pair(ps, qs, scalars) == g1.pair(g2) ** (2 * 3 * 7 - 5 * 11)
+
+    with pytest.raises(TypeError):
+        bgp.multi_pair(qs, ps)
+
+    with pytest.raises(TypeError):
+        bgp.multi_pair(ps, qs, ["foo"] * 3)
+
+    with pytest.raises(ValueError):
+        bgp.multi_pair(ps, qs[:1])
+
+    with pytest.raises(ValueError):
+        bgp.multi_pair(ps, qs, scalars[:1])
+
+
 def test_is_valid(group):
     assert group.generator().is_valid()
     assert (100 * group.generator()).is_valid()
@@ -99,6 +138,14 @@ def test_hash_to_point_G2(group):
     assert h1 != h2
 
 
+def test_hash_to_point_batch(group):
+    hinputs = [b'foo', b'bar', b'', b'x' * 1024]
+    elems = group.hash_to_point_batch(hinputs)
+    assert elems == [group.hash_to_point(h) for h in hinputs]
+    assert all(isinstance(el, group._element_type()) for el in elems)
+    assert group.hash_to_point_batch([]) == []
+
+
 @pytest.mark.skip(reason="not planning to implement this for now")
 def test_ec_from_x(group):
     g = group.generator()
@@ -144,6 +191,45 @@ def test_ec_arithmetic(group):
     assert (g * a).is_neutral_element()
 
 
+def test_hash_follows_inplace_updates(group):
+    g = group.generator()
+    a = group.generator()
+    assert hash(a) == hash(g)
+    a += g
+    assert hash(a) == hash(2 * g)
+    assert repr(a) == repr(2 * g)
+    a.idouble()
+    assert hash(a) == hash(4 * g)
+    assert hash(copy.copy(a)) == hash(4 * g)
+
+    b = GT.generator()
+    assert hash(b) == hash(GT.generator())
+    b *= b
+    assert hash(b) == hash(GT.generator() ** 2)
+
+
+def test_small_scalar_multiplication(group):
+    h = group.hash_to_point(b"small scalars")
+    assert 3 * h == h + h + h
+    assert -3 * h == -(h + h + h)
+    assert (0 * h).is_neutral_element()
+    assert (2 ** 64 + 1) * h == Bn(2 ** 64) * h + h
+
+
+def test_secret_scalar_multiplication(group):
+    h = group.hash_to_point(b"secret scalars")
+    order = group.order()
+    k = order.random()
+    assert h.mul_secret(k) == k * h
+    assert h.mul_secret(-5) == -5 * h
+    assert h.mul_secret(order).is_neutral_element()
+
+    with pytest.raises(TypeError):
+        h.mul_secret("foo")
+    with pytest.raises(TypeError):
+        h.mul_secret(h)
+
+
 def test_gt_multiplication():
     g = GT.generator()
     assert not g == 5
@@ -173,6 +259,23 @@ def test_gt_inverse():
     assert elem.inverse() == elem ** (-1)
 
 
+def test_order_is_not_shared(group):
+    order = group.order()
+    assert order is not group.order()
+    assert order == group.order()
+    assert (order * group.generator()).is_neutral_element()
+
+
+def test_gt_order_is_not_shared():
+    order = GT.order()
+    assert order is not GT.order()
+
+    # Modifying the returned order must not affect the group
+    _ = GT.generator() ** order
+    assert GT.order() == order
+    assert (GT.generator() ** GT.order()).is_neutral_element()
+
+
 def test_gt_exponentiation():
     g = GT.generator()
 
@@ -182,6 +285,77 @@ def test_gt_exponentiation():
     assert g ** Bn(10) == g.pow(Bn(10))
 
 
+def test_precompute(group):
+    order = group.order()
+    elem = order.random() * group.generator()
+    plain = copy.copy(elem)
+    assert elem.precompute() is elem
+
+    for k in [0, 1, 2, 1337, order - 1, order + 5, 3 * order + 1, order * order - 2, -7,
+              order.random()]:
+        assert k * elem == k * plain
+
+    # The table should not survive in-place modifications
+    elem += group.generator()
+    assert 42 * elem == 42 * (plain + group.generator())
+
+
+def test_generator_multiplication(group):
+    g = group.generator()
+    h = g + group.neutral_element()
+    order = group.order()
+
+    for k in [0, 1, 2, 1337, order - 1, order + 5, 3 * order + 1, order * order - 2, -7,
+              order.random()]:
+        assert k * g == k * h
+
+    # In-place operations must forget about the generator
+    a = group.generator()
+    a += g
+    assert 3 * a == 6 * g
+    a = group.generator()
+    a.idouble()
+    assert 3 * a == 6 * g
+
+    # Nor may a precomputed generator keep its table after in-place scaling
+    a = group.generator().precompute()
+    a *= 3
+    a *= 5
+    assert a == 15 * g
+
+
+def test_precompute_gt():
+    order = GT.order()
+    elem = GT.generator() ** order.random()
+    plain = copy.copy(elem)
+    assert elem.precompute() is elem
+
+    for k in [0, 1, 2, 1337, order - 1, order + 5, 3 * order + 1, order * order - 2, -7,
+              order.random()]:
+        assert elem ** k == plain ** k
+
+    elem *= GT.generator()
+    assert elem ** 42 == (plain * GT.generator()) ** 42
+
+
+def test_gt_generator_exponentiation():
+    g = GT.generator()
+    h = g * GT.neutral_element()
+    order = GT.order()
+
+    for k in [0, 1, 2, 1337, order - 1, order + 5, 3 * order + 1, order * order - 2, -7,
+              order.random()]:
+        assert g ** k == h ** k
+
+    # In-place operations must forget about the generator
+    a = GT.generator()
+    a *= g
+    assert a ** 3 == g ** 6
+    a = GT.generator()
+    a.isquare()
+    assert a ** 3 == g ** 6
+
+
 def test_g1_get_affine_coordinates():
     g = G1.generator()
     x, y = g.get_affine_coordinates()
@@ -192,6 +366,14 @@ def test_g1_export_length():
     assert len(g.to_binary()) == 49
 
 
+def test_export_lengths():
+    assert len(G1.generator().to_binary(compressed=False)) == 97
+    assert len(G2.generator().to_binary()) == 97
+    assert len(G2.generator().to_binary(compressed=False)) == 193
+    assert len(GT.generator().to_binary()) == 384
+    assert len(GT.generator().to_binary(compressed=False)) == 576
+
+
 def test_ec_binary_encoding(group):
     g = group.generator()
     i = group.neutral_element()
@@ -209,24 +391,43 @@ def test_gt_binary_encoding(group):
     assert GTElement.from_binary(i.to_binary()) == i
 
 
-@pytest.mark.skip(reason="not planning to implement this for now")
 def test_ec_sum(group):
     g = group.generator()
     assert group.sum([g] * 10) == (10 * g)
+    assert group.sum([g] * 7) == (7 * g)
+    assert group.sum([g]) == g
 
     order = group.order()
     h = order.random() * g
     assert group.wsum([Bn(10), Bn(20)], [g, h]) == 10 * g + 20 * h
+    assert group.wsum([-3, 5], [g, h]) == -3 * g + 5 * h
+    assert group.wsum([5, -3], [h, g]) == -3 * g + 5 * h
+    assert group.wsum([2, 3], [g, g]) == 5 * g
+    assert group.wsum([order + 3, 3 * order - 2], [g, h]) == 3 * g - 2 * h
+    assert group.wsum([3 * order - 2, order + 3], [h, g]) == 3 * g - 2 * h
+    assert group.wsum([7], [h]) == 7 * h
+    assert group.wsum([2, 3, 4], [g, h, g]) == 6 * g + 3 * h
+    assert group.wsum([-1, 2, -3], [h, g, h]) == 2 * g - 4 * h
+    assert group.sum([]) == group.neutral_element()
+    assert group.wsum([], []) == group.neutral_element()
 
 
-@pytest.mark.skip(reason="not planning to implement this for now")
 def test_gt_prod():
     g = GT.generator()
-    assert group.prod([g] * 10) == (g ** 10)
+    assert GT.prod([g] * 10) == (g ** 10)
+    assert GT.prod([g] * 7) == (g ** 7)
+    assert GT.prod([g]) == g
+    assert GT.prod([]) == GT.neutral_element()
 
     order = GT.order()
     h = g ** order.random()
-    assert group.wprod([Bn(10), Bn(20)], [g, h]) == g ** 10 * h ** 20
+    assert GT.wprod([Bn(10), Bn(20)], [g, h]) == g ** 10 * h ** 20
+    assert GT.wprod([-3, 5], [g, h]) == g ** (-3) * h ** 5
+    assert GT.wprod([-1, 2, -3], [h, g, h]) == g ** 2 * h ** (-4)
+    assert GT.wprod([], []) == GT.neutral_element()
+
+    with pytest.raises(TypeError):
+        GT.wprod(["foo"], [g])
 
 
 def test_iadd(group):
@@ -270,6 +471,27 @@ def test_double(group):
     assert id(b) == id(a)
 
 
+def test_double_into(group):
+    g = group.generator()
+    out = group.neutral_element()
+    assert g.double_into(out) is out
+    assert out == g.double()
+    assert g == group.generator()
+
+    with pytest.raises(TypeError):
+        g.double_into(GT.neutral_element())
+
+
+def test_square_into():
+    g = GT.generator()
+    out = GT.neutral_element()
+    assert g.square_into(out) is out
+    assert out == g.square()
+
+    with pytest.raises(TypeError):
+        g.square_into(G1.neutral_element())
+
+
 def test_square():
     """
     Does square() square correctly?
@@ -305,6 +527,21 @@ def test_imul(group):
     assert id(b) == id(a)
 
 
+def test_idiv():
+    g = GT.generator()
+    a = g ** 100
+    b = g ** 100
+    a /= g ** 30
+    assert a == g ** 70
+    assert b / g ** 30 == a
+
+    a = GT.generator() ** 42
+    c = a
+    a /= a
+    assert id(c) == id(a)
+    assert a == GT.neutral_element()
+
+
 def test_iexp():
     g = GT.generator()
     a = g ** 100
@@ -52,6 +52,21 @@ def test_pair_type():
         a.pair(11)
 
 
+def test_multi_pair():
+    bgp = BilinearGroupPair()
+    g1, g2 = G1Group.generator(), G2Group.generator()
+
+    res = bgp.multi_pair([g1 * 3, g1 * 5], [g2 * 7, g2 * 11])
+    assert res == g1.pair(g2) ** (3 * 7 + 5 * 11)
+    assert isinstance(res, GTElem)
+
+    res = bgp.multi_pair([g1, g1], [g2 * 7, g2 * 11], [3, 5])
+    assert res == g1.pair(g2) ** (3 * 7 + 5 * 11)
+
+    with pytest.raises(TypeError):
+        bgp.multi_pair([g2], [g1])
+
+
 def test_copy(group):
     elem = 42 * group.generator()
     elem_copy = copy.copy(elem)